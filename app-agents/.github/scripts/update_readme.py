@@ -10,13 +10,113 @@ Author: Manus AI
 Created: 2025-09-20
 """
 
+import hashlib
 import os
 import re
 import json
-import yaml
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from itertools import takewhile
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-import pandas as pd
+from typing import Dict, List, Any, Optional, Tuple
+
+# Patterns used while parsing agent documentation and rewriting README sections
+_PARA_SPLIT_RE = re.compile(r'\n\s*\n')
+_CAP_ITEM_RE = re.compile(r'[-*]\s*\*\*(.*?)\*\*:?\s*(.*?)(?=\n[-*]|\n\n|$)', re.DOTALL)
+_HEADER2_SPLIT_RE = re.compile(r'(?m)^(?=## )')
+
+# README headings the generated sections are placed relative to
+_AGENTS_HEADING = "## 🤖 Available Agents"
+_CATEGORIES_HEADING = "## 🎯 Agent Categories"
+_METRICS_HEADING = "## 📊 Agent Performance Metrics"
+_GETTING_STARTED_HEADING = "## Getting Started"
+
+# File extensions treated as agent datasets
+_DATASET_EXTS = frozenset({'.xlsx', '.csv', '.json', '.yaml', '.yml'})
+
+# Keywords used to infer an agent's category from its name and description
+_RESEARCH_KW = frozenset({'crawl', 'scrape', 'extract', 'research', 'analysis'})
+_DESIGN_KW = frozenset({'ui', 'ux', 'design', 'interface', 'visual'})
+_DEVELOPMENT_KW = frozenset({'code', 'develop', 'architect', 'build', 'generate'})
+_CONTENT_KW = frozenset({'content', 'write', 'document', 'communication'})
+
+# One alternation per category, checked in priority order
+_CATEGORY_PATTERNS = [
+    (category, re.compile('|'.join(sorted(map(re.escape, keywords)))))
+    for category, keywords in (
+        ("Research & Analysis", _RESEARCH_KW),
+        ("Design & UX", _DESIGN_KW),
+        ("Development", _DEVELOPMENT_KW),
+        ("Content & Communication", _CONTENT_KW),
+    )
+]
+
+# Focus area shown for each category in the categories table
+_CATEGORY_DESCRIPTIONS = {
+    "Research & Analysis": "Web crawling, data extraction, competitive analysis",
+    "Design & UX": "Interface design, user experience, accessibility",
+    "Development": "Code generation, architecture guidance, testing",
+    "Content & Communication": "Content creation, documentation, technical writing"
+}
+
+# Longest subtitle shown under an agent heading before it is truncated
+_SUBTITLE_MAX = 100
+
+# Parsed agent docs are cached between runs. Entries match on the docs'
+# stat metadata, which costs no reads, or else on a digest of their contents,
+# which survives a fresh checkout
+_CACHE_VERSION = 3
+_CACHED_FIELDS = ("description", "overview", "special_functions")
+_SOURCE_FILES = ("agents.md", "README.md")
+
+def _split_sections(content: str) -> Dict[str, List[str]]:
+    """Split markdown into ``## `` sections in a single pass over its lines.
+
+    Keys are lower-cased heading titles; only the first occurrence of a
+    heading is kept. A deeper heading (``###``) ends the current section
+    once it has content, so each buffer holds the section's lead-in text.
+    """
+    sections: Dict[str, List[str]] = {}
+    current: Optional[List[str]] = None
+    has_content = False
+    
+    for line in content.splitlines():
+        if line.startswith('## '):
+            title = line[3:].strip().lower()
+            current = None if title in sections else sections.setdefault(title, [])
+            has_content = False
+        elif line.startswith('##'):
+            if has_content:
+                current = None
+        elif current is not None:
+            current.append(line)
+            has_content = has_content or bool(line.strip())
+    
+    return sections
+
+def _replace_section(chunks: List[str], heading: str, replacement: str,
+                     stop_headings: Tuple[str, ...], insert_before: Tuple[str, ...]) -> None:
+    """Replace the README chunk starting with ``heading`` in place.
+    
+    ``chunks`` is the README split at each ``## `` heading. The old section
+    runs until the next chunk starting with one of ``stop_headings``. If the
+    section is missing, it is inserted before the first heading found from
+    ``insert_before``, tried in order.
+    """
+    for start, chunk in enumerate(chunks):
+        if chunk.startswith(heading):
+            end = next(
+                (i for i in range(start + 1, len(chunks)) if chunks[i].startswith(stop_headings)),
+                len(chunks)
+            )
+            chunks[start:end] = [replacement]
+            return
+    
+    for anchor in insert_before:
+        for i, chunk in enumerate(chunks):
+            if chunk.startswith(anchor):
+                chunks.insert(i, replacement + "\n")
+                return
 
 class AgentInfo:
     """Represents information about an agent."""
@@ -32,111 +132,211 @@ class AgentInfo:
         self.category = "General"
         self.performance_metrics = {}
         
-    def load_from_agents_md(self) -> bool:
-        """Load agent information from agents.md file."""
-        agents_md_path = self.path / "agents.md"
-        if not agents_md_path.exists():
-            return False
-            
+    def load_from_agents_md(self, content: Optional[str] = None) -> bool:
+        """Load agent information from agents.md file, or its already read ``content``."""
         try:
-            with open(agents_md_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
+            if content is None:
+                content = (self.path / "agents.md").read_text(encoding='utf-8')
+            
+            sections = _split_sections(content)
+            
             # Extract description
-            desc_match = re.search(r'## Description\s*\n\n(.*?)(?=\n##|\n\n##|$)', content, re.DOTALL)
-            if desc_match:
-                self.description = desc_match.group(1).strip()
+            if 'description' in sections:
+                self.description = '\n'.join(sections['description']).strip()
                 
             # Extract capabilities/functions
-            cap_match = re.search(r'## Capabilities\s*\n(.*?)(?=\n##|$)', content, re.DOTALL)
-            if cap_match:
-                cap_content = cap_match.group(1)
+            if 'capabilities' in sections:
+                cap_content = '\n'.join(sections['capabilities']).strip()
                 # Extract bullet points or list items
-                functions = re.findall(r'[-*]\s*\*\*(.*?)\*\*:?\s*(.*?)(?=\n[-*]|\n\n|$)', cap_content, re.DOTALL)
+                functions = _CAP_ITEM_RE.findall(cap_content)
                 self.special_functions = [f"{func.strip()}: {desc.strip()}" for func, desc in functions]
                 
             return True
             
+        except (FileNotFoundError, IsADirectoryError):
+            return False
         except Exception as e:
             print(f"Error reading agents.md for {self.name}: {e}")
             return False
     
-    def load_from_readme(self) -> bool:
-        """Load agent information from README.md file."""
-        readme_path = self.path / "README.md"
-        if not readme_path.exists():
-            return False
-            
+    def load_from_readme(self, content: Optional[str] = None) -> bool:
+        """Load agent information from README.md file, or its already read ``content``."""
         try:
-            with open(readme_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
+            if content is None:
+                content = (self.path / "README.md").read_text(encoding='utf-8')
+            
             # Extract description from first paragraph or summary
-            lines = content.split('\n')
-            for i, line in enumerate(lines):
-                if line.strip() and not line.startswith('#') and not line.startswith('**'):
-                    # Found first content line
-                    desc_lines = []
-                    for j in range(i, len(lines)):
-                        if lines[j].strip() == '' or lines[j].startswith('#'):
-                            break
-                        desc_lines.append(lines[j].strip())
-                    self.description = ' '.join(desc_lines)
+            for paragraph in _PARA_SPLIT_RE.split(content):
+                lines = paragraph.split('\n')
+                start = next(
+                    (i for i, line in enumerate(lines)
+                     if line.strip() and not line.startswith(('#', '**'))),
+                    None
+                )
+                if start is not None:
+                    # Found first content line; the paragraph ends at the next heading
+                    body = takewhile(lambda line: not line.startswith('#'), lines[start:])
+                    self.description = ' '.join(line.strip() for line in body)
                     break
                     
             # Extract overview from ## Overview section if exists
-            overview_match = re.search(r'## .*Overview.*\s*\n\n(.*?)(?=\n##|\n\n##|$)', content, re.DOTALL | re.IGNORECASE)
-            if overview_match:
-                self.overview = overview_match.group(1).strip()
+            sections = _split_sections(content)
+            overview = next((body for title, body in sections.items() if 'overview' in title), None)
+            if overview is not None:
+                self.overview = '\n'.join(overview).strip()
             else:
                 # Use description as overview if no separate overview section
                 self.overview = self.description
                 
             return True
             
+        except (FileNotFoundError, IsADirectoryError):
+            return False
         except Exception as e:
             print(f"Error reading README.md for {self.name}: {e}")
             return False
     
     def detect_datasets(self) -> None:
         """Detect dataset files in the agent directory."""
-        dataset_extensions = ['.xlsx', '.csv', '.json', '.yaml', '.yml']
-        
         # Check docs directory
-        docs_path = self.path / "docs"
-        if docs_path.exists():
-            for file_path in docs_path.rglob("*"):
-                if file_path.suffix.lower() in dataset_extensions:
+        for root, _dirs, files in os.walk(self.path / "docs"):
+            for name in files:
+                suffix = os.path.splitext(name)[1].lower()
+                if suffix in _DATASET_EXTS:
+                    file_path = Path(root, name)
                     self.datasets.append({
-                        "name": file_path.name,
+                        "name": name,
                         "path": str(file_path.relative_to(self.path)),
-                        "type": file_path.suffix.lower()[1:]  # Remove the dot
+                        "type": suffix[1:]  # Remove the dot
                     })
         
         # Check root agent directory
-        for file_path in self.path.glob("*"):
-            if file_path.suffix.lower() in dataset_extensions:
-                self.datasets.append({
-                    "name": file_path.name,
-                    "path": str(file_path.relative_to(self.path)),
-                    "type": file_path.suffix.lower()[1:]
-                })
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                suffix = os.path.splitext(entry.name)[1].lower()
+                if suffix in _DATASET_EXTS and entry.is_file():
+                    self.datasets.append({
+                        "name": entry.name,
+                        "path": entry.name,
+                        "type": suffix[1:]
+                    })
+    
+    def load_from_cache(self, entry: Dict[str, Any]) -> None:
+        """Restore fields previously parsed from the agent's docs."""
+        for field in _CACHED_FIELDS:
+            setattr(self, field, entry[field])
+    
+    def cache_entry(self, stamp: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the parsed doc fields together with the stamp they belong to."""
+        entry: Dict[str, Any] = {"stamp": stamp}
+        for field in _CACHED_FIELDS:
+            entry[field] = getattr(self, field)
+        return entry
+    
+    # Computed on first use, which must come after the docs are loaded
+    @cached_property
+    def name_lower(self) -> str:
+        """Lower-cased name, for keyword matching."""
+        return self.name.lower()
+    
+    @cached_property
+    def desc_lower(self) -> str:
+        """Lower-cased description, for keyword matching."""
+        return self.description.lower()
+    
+    @cached_property
+    def search_text(self) -> str:
+        """Lower-cased name and description together, for keyword matching."""
+        return f"{self.name_lower} {self.desc_lower}"
     
     def infer_category(self) -> None:
         """Infer agent category based on name and description."""
-        name_lower = self.name.lower()
-        desc_lower = self.description.lower()
+        for category, pattern in _CATEGORY_PATTERNS:
+            if pattern.search(self.search_text):
+                self.category = category
+                return
         
-        if any(word in name_lower or word in desc_lower for word in ['crawl', 'scrape', 'extract', 'research', 'analysis']):
-            self.category = "Research & Analysis"
-        elif any(word in name_lower or word in desc_lower for word in ['ui', 'ux', 'design', 'interface', 'visual']):
-            self.category = "Design & UX"
-        elif any(word in name_lower or word in desc_lower for word in ['code', 'develop', 'architect', 'build', 'generate']):
-            self.category = "Development"
-        elif any(word in name_lower or word in desc_lower for word in ['content', 'write', 'document', 'communication']):
-            self.category = "Content & Communication"
+        self.category = "General"
+
+@lru_cache(maxsize=256)
+def _infer_use_cases(name_lower: str, desc_lower: str) -> Tuple[str, ...]:
+    """Infer use cases from a lower-cased agent name and description."""
+    use_cases = []
+    
+    if 'crawl' in name_lower or 'crawl' in desc_lower:
+        use_cases.extend(["Web scraping", "Data extraction", "Competitive analysis"])
+    
+    if 'ui' in name_lower or 'design' in desc_lower:
+        use_cases.extend(["Interface design", "User experience optimization", "Accessibility auditing"])
+    
+    if 'architect' in name_lower or 'architect' in desc_lower:
+        use_cases.extend(["System design", "Architecture planning", "Best practices guidance"])
+    
+    if 'research' in desc_lower:
+        use_cases.extend(["Research analysis", "Data synthesis"])
+    
+    # Remove duplicates while preserving order, limited to 5 use cases
+    return tuple(dict.fromkeys(use_cases))[:5]
+
+def _source_stat(agent_dir: Path) -> List[Optional[List[int]]]:
+    """Return ``[mtime_ns, size]`` for each doc file an agent is parsed from."""
+    stat: List[Optional[List[int]]] = []
+    for filename in _SOURCE_FILES:
+        try:
+            st = os.stat(agent_dir / filename)
+        except OSError:
+            stat.append(None)
         else:
-            self.category = "General"
+            stat.append([st.st_mtime_ns, st.st_size])
+    return stat
+
+def _read_sources(agent_dir: Path) -> Tuple[List[Optional[str]], List[Optional[str]]]:
+    """Read each doc file once, returning its text and its content digest."""
+    texts: List[Optional[str]] = []
+    digests: List[Optional[str]] = []
+    for filename in _SOURCE_FILES:
+        try:
+            data = (agent_dir / filename).read_bytes()
+        except OSError:
+            texts.append(None)
+            digests.append(None)
+            continue
+        digests.append(hashlib.blake2b(data, digest_size=16).hexdigest())
+        try:
+            # Same newline handling as read_text
+            texts.append(data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n'))
+        except UnicodeDecodeError:
+            texts.append(None)  # the loader rereads the file and reports the error
+    return texts, digests
+
+def _process_agent(agent_dir: Path, cached: Optional[Dict[str, Any]] = None) -> Tuple[AgentInfo, Dict[str, Any]]:
+    """Load, index and classify the agent stored in ``agent_dir``.
+    
+    Parsing is skipped when ``cached`` was recorded for the same doc files:
+    unchanged stat metadata avoids reading them at all, and otherwise each
+    file is read once for both the digest check and parsing.
+    Returns the agent and the cache entry to persist for it.
+    """
+    agent = AgentInfo(agent_dir.name, agent_dir)
+    cached_stamp = cached.get("stamp", {}) if cached is not None else {}
+    stat = _source_stat(agent_dir)
+    
+    if cached_stamp.get("stat") == stat:
+        agent.load_from_cache(cached)
+        digests = cached_stamp["digest"]
+    else:
+        texts, digests = _read_sources(agent_dir)
+        if cached_stamp.get("digest") == digests:
+            agent.load_from_cache(cached)
+        # Try to load from agents.md first, then README.md
+        elif not agent.load_from_agents_md(texts[0]):
+            agent.load_from_readme(texts[1])
+    
+    # Detect datasets and infer category
+    agent.detect_datasets()
+    agent.infer_category()
+    
+    return agent, agent.cache_entry({"stat": stat, "digest": digests})
 
 class ReadmeUpdater:
     """Updates README.md with current agent information."""
@@ -146,27 +346,59 @@ class ReadmeUpdater:
         self.agents_dir = repo_root / "agents"
         self.readme_path = repo_root / "README.md"
         self.agents: List[AgentInfo] = []
+        self.cache_path = repo_root / ".cache" / "readme_agents.json"
+        
+    def load_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load parsed agent docs from previous runs, if any."""
+        try:
+            data = json.loads(self.cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+            return {}
+        return data.get("agents", {})
+    
+    def save_cache(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Persist parsed agent docs for the next run."""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_path.write_text(
+                json.dumps({"version": _CACHE_VERSION, "agents": entries}),
+                encoding='utf-8'
+            )
+        except OSError as e:
+            print(f"Warning: could not write agent cache: {e}")
         
     def scan_agents(self) -> None:
         """Scan the agents directory for available agents."""
-        if not self.agents_dir.exists():
+        try:
+            with os.scandir(self.agents_dir) as it:
+                entries = list(it)
+        except FileNotFoundError:
             print("No agents directory found")
             return
             
-        for agent_dir in self.agents_dir.iterdir():
-            if agent_dir.is_dir() and not agent_dir.name.startswith('.'):
-                agent = AgentInfo(agent_dir.name, agent_dir)
-                
-                # Try to load from agents.md first, then README.md
-                if not agent.load_from_agents_md():
-                    agent.load_from_readme()
-                
-                # Detect datasets and infer category
-                agent.detect_datasets()
-                agent.infer_category()
-                
-                self.agents.append(agent)
-                print(f"Found agent: {agent.name} ({agent.category})")
+        agent_dirs = [
+            Path(entry.path) for entry in entries
+            if entry.is_dir() and not entry.name.startswith('.')
+        ]
+        
+        cache = self.load_cache()
+        
+        # Agents are independent and mostly I/O bound, so load them concurrently
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(
+                lambda agent_dir: _process_agent(agent_dir, cache.get(agent_dir.name)),
+                agent_dirs
+            ))
+        
+        # Report in directory order regardless of completion order
+        for agent, _ in results:
+            self.agents.append(agent)
+            print(f"Found agent: {agent.name} ({agent.category})")
+        
+        self.save_cache({agent.name: entry for agent, entry in results})
     
     def generate_agent_section(self, agent: AgentInfo) -> str:
         """Generate markdown section for an agent."""
@@ -175,81 +407,57 @@ class ReadmeUpdater:
         if display_name.endswith(' Agent'):
             display_name = display_name[:-6]  # Remove ' Agent' suffix
         
-        section = f"### {display_name}\n"
+        parts = [f"### {display_name}\n"]
         
         # Add subtitle based on description
         if agent.description:
             # Extract first sentence or phrase as subtitle
             first_sentence = agent.description.split('.')[0].strip()
-            if len(first_sentence) > 100:
-                first_sentence = first_sentence[:97] + "..."
-            section += f"**{first_sentence}**\n\n"
+            if len(first_sentence) > _SUBTITLE_MAX:
+                first_sentence = first_sentence[:_SUBTITLE_MAX - 3] + "..."
+            parts.append(f"**{first_sentence}**\n\n")
         
         # Description
         if agent.description:
-            section += f"- **Description**: {agent.description}\n"
+            parts.append(f"- **Description**: {agent.description}\n")
         
         # Overview
         if agent.overview and agent.overview != agent.description:
-            section += f"- **Overview**: {agent.overview}\n"
+            parts.append(f"- **Overview**: {agent.overview}\n")
         
         # Special Functions
         if agent.special_functions:
-            section += "- **Special Functions**:\n"
+            parts.append("- **Special Functions**:\n")
             for func in agent.special_functions[:6]:  # Limit to 6 functions
-                section += f"  - {func}\n"
+                parts.append(f"  - {func}\n")
         
         # Datasets
         if agent.datasets:
-            section += "- **Dataset(s)**:\n"
+            parts.append("- **Dataset(s)**:\n")
             for dataset in agent.datasets:
-                section += f"  - `{dataset['name']}` ({dataset['type'].upper()}) - "
+                parts.append(f"  - `{dataset['name']}` ({dataset['type'].upper()}) - ")
                 # Add description based on filename
-                if 'sample' in dataset['name'].lower():
-                    section += "Example data structure and format\n"
-                elif 'research' in dataset['name'].lower():
-                    section += "Comprehensive research database\n"
-                elif 'crawl' in dataset['name'].lower():
-                    section += "Web crawling results and analysis\n"
+                name_lower = dataset['name'].lower()
+                if 'sample' in name_lower:
+                    parts.append("Example data structure and format\n")
+                elif 'research' in name_lower:
+                    parts.append("Comprehensive research database\n")
+                elif 'crawl' in name_lower:
+                    parts.append("Web crawling results and analysis\n")
                 else:
-                    section += "Agent-specific dataset\n"
+                    parts.append("Agent-specific dataset\n")
         
         # Use Cases (inferred from category and description)
         use_cases = self.infer_use_cases(agent)
         if use_cases:
-            section += f"- **Use Cases**: {', '.join(use_cases)}\n"
+            parts.append(f"- **Use Cases**: {', '.join(use_cases)}\n")
         
-        section += "\n"
-        return section
+        parts.append("\n")
+        return ''.join(parts)
     
     def infer_use_cases(self, agent: AgentInfo) -> List[str]:
         """Infer use cases based on agent information."""
-        use_cases = []
-        
-        name_lower = agent.name.lower()
-        desc_lower = agent.description.lower()
-        
-        if 'crawl' in name_lower or 'crawl' in desc_lower:
-            use_cases.extend(["Web scraping", "Data extraction", "Competitive analysis"])
-        
-        if 'ui' in name_lower or 'design' in desc_lower:
-            use_cases.extend(["Interface design", "User experience optimization", "Accessibility auditing"])
-        
-        if 'architect' in name_lower or 'architect' in desc_lower:
-            use_cases.extend(["System design", "Architecture planning", "Best practices guidance"])
-        
-        if 'research' in desc_lower:
-            use_cases.extend(["Research analysis", "Data synthesis"])
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_use_cases = []
-        for use_case in use_cases:
-            if use_case not in seen:
-                seen.add(use_case)
-                unique_use_cases.append(use_case)
-        
-        return unique_use_cases[:5]  # Limit to 5 use cases
+        return list(_infer_use_cases(agent.name_lower, agent.desc_lower))
     
     def generate_category_table(self) -> str:
         """Generate the agent categories table."""
@@ -260,83 +468,76 @@ class ReadmeUpdater:
                 categories[agent.category] = []
             categories[agent.category].append(agent.name.replace('-', ' ').replace('_', ' ').title())
         
-        table = "| Category | Agents | Focus Area |\n"
-        table += "|----------|--------|------------|\n"
-        
-        category_descriptions = {
-            "Research & Analysis": "Web crawling, data extraction, competitive analysis",
-            "Design & UX": "Interface design, user experience, accessibility",
-            "Development": "Code generation, architecture guidance, testing",
-            "Content & Communication": "Content creation, documentation, technical writing"
-        }
+        rows = [
+            "| Category | Agents | Focus Area |\n",
+            "|----------|--------|------------|\n",
+        ]
         
         for category, agents in categories.items():
             agents_str = ", ".join(agents)
-            focus = category_descriptions.get(category, "Specialized domain expertise")
-            table += f"| **{category}** | {agents_str} | {focus} |\n"
+            focus = _CATEGORY_DESCRIPTIONS.get(category, "Specialized domain expertise")
+            rows.append(f"| **{category}** | {agents_str} | {focus} |\n")
         
         # Add placeholder categories if no agents exist yet
-        for category, focus in category_descriptions.items():
+        for category, focus in _CATEGORY_DESCRIPTIONS.items():
             if category not in categories:
-                table += f"| **{category}** | *Coming Soon* | {focus} |\n"
+                rows.append(f"| **{category}** | *Coming Soon* | {focus} |\n")
         
-        return table
+        return ''.join(rows)
     
     def update_readme(self) -> bool:
         """Update the README.md file with current agent information."""
-        if not self.readme_path.exists():
-            print("README.md not found")
-            return False
-        
         try:
-            with open(self.readme_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self.readme_path.read_text(encoding='utf-8')
+            original_content = content
             
             # Generate new agents section
-            agents_section = "## 🤖 Available Agents\n\n"
-            agents_section += "This repository currently contains the following specialized AI agents:\n\n"
+            agents_parts = [
+                f"{_AGENTS_HEADING}\n\n",
+                "This repository currently contains the following specialized AI agents:\n\n",
+            ]
             
             # Sort agents by category and name
             sorted_agents = sorted(self.agents, key=lambda x: (x.category, x.name))
             
-            for agent in sorted_agents:
-                agents_section += self.generate_agent_section(agent)
+            agents_parts.extend(self.generate_agent_section(agent) for agent in sorted_agents)
+            agents_section = ''.join(agents_parts)
             
             # Generate categories table
-            categories_section = "## 🎯 Agent Categories\n\n"
-            categories_section += "Our agents are organized into specialized categories:\n\n"
-            categories_section += self.generate_category_table()
+            categories_section = ''.join([
+                f"{_CATEGORIES_HEADING}\n\n",
+                "Our agents are organized into specialized categories:\n\n",
+                self.generate_category_table(),
+            ])
             
-            # Replace existing sections
-            # Find and replace the agents section
-            agents_pattern = r'## 🤖 Available Agents.*?(?=## 🎯 Agent Categories|## 📊 Agent Performance Metrics|## Getting Started|$)'
-            if re.search(agents_pattern, content, re.DOTALL):
-                content = re.sub(agents_pattern, agents_section, content, flags=re.DOTALL)
-            else:
-                # Insert after repository structure if agents section doesn't exist
-                structure_end = content.find("## Getting Started")
-                if structure_end != -1:
-                    content = content[:structure_end] + agents_section + "\n" + content[structure_end:]
+            # Replace existing sections, inserting them if missing
+            chunks = _HEADER2_SPLIT_RE.split(content)
+            _replace_section(
+                chunks, _AGENTS_HEADING, agents_section,
+                stop_headings=(_CATEGORIES_HEADING, _METRICS_HEADING, _GETTING_STARTED_HEADING),
+                insert_before=(_GETTING_STARTED_HEADING,)
+            )
+            _replace_section(
+                chunks, _CATEGORIES_HEADING, categories_section,
+                stop_headings=(_METRICS_HEADING, _GETTING_STARTED_HEADING),
+                insert_before=(_METRICS_HEADING, _GETTING_STARTED_HEADING)
+            )
+            content = ''.join(chunks)
             
-            # Replace categories section
-            categories_pattern = r'## 🎯 Agent Categories.*?(?=## 📊 Agent Performance Metrics|## Getting Started|$)'
-            if re.search(categories_pattern, content, re.DOTALL):
-                content = re.sub(categories_pattern, categories_section, content, flags=re.DOTALL)
-            else:
-                # Insert after agents section
-                agents_end = content.find("## 📊 Agent Performance Metrics")
-                if agents_end == -1:
-                    agents_end = content.find("## Getting Started")
-                if agents_end != -1:
-                    content = content[:agents_end] + categories_section + "\n" + content[agents_end:]
+            # Leave the file untouched when nothing changed
+            if content == original_content:
+                print(f"ℹ️ README.md already up to date with {len(self.agents)} agents")
+                return True
             
             # Write updated content
-            with open(self.readme_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            self.readme_path.write_text(content, encoding='utf-8')
             
             print(f"✅ Updated README.md with {len(self.agents)} agents")
             return True
             
+        except FileNotFoundError:
+            print("README.md not found")
+            return False
         except Exception as e:
             print(f"Error updating README.md: {e}")
             return False
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Numba kernel for batch weather simulation
+
+Compiled temperature generation used by ``WeatherAPITool.simulate_batch`` for
+large batches. Numba is optional: without it ``sim_core`` is None and the
+batch simulator stays on its NumPy path.
+
+Author: Agent-Builder Framework
+Created: 2025-09-20
+"""
+
+try:
+    import numpy as np
+    from numba import njit, prange
+except ImportError:  # optional: JIT-compiled batch simulation
+    njit = None
+
+# Batches at or below this size stay on the NumPy path; below a few hundred
+# locations the JIT dispatch overhead outweighs the compiled loop.
+NUMBA_THRESHOLD = 500
+
+# Integer codes for the units argument of sim_core
+UNITS_CODES = {"celsius": 0, "fahrenheit": 1, "kelvin": 2}
+
+
+if njit is not None:
+    @njit(cache=True, parallel=True)
+    def sim_core(base_temps, units_code, seed):
+        """Return simulated temperatures for an array of Celsius base temperatures."""
+        count = base_temps.shape[0]
+        # Draw on the calling thread: seeding does not reach the per-thread
+        # generators prange workers use, so draws there would not be
+        # reproducible for a given seed
+        np.random.seed(seed)
+        offsets = np.empty(count, dtype=np.int64)
+        for i in range(count):
+            offsets[i] = np.random.randint(-5, 6)
+        
+        temperatures = np.empty(count, dtype=np.float64)
+        for i in prange(count):
+            temperature = base_temps[i] + offsets[i]
+            if units_code == 1:
+                temperature = temperature * 9.0 / 5.0 + 32.0
+            elif units_code == 2:
+                temperature = temperature + 273.15
+            temperatures[i] = temperature
+        return temperatures
+else:
+    sim_core = None
@@ -9,12 +9,46 @@ Author: Agent-Builder Framework
 Created: 2025-09-20
 """
 
+import asyncio
 import logging
 import json
-from typing import Dict, Any, List, Optional
+import random
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Deque, Dict, Any, List, Mapping, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON export
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # optional: vectorized batch simulation
+    np = None
+
+# The kernel module sits next to this file: a sibling module when src/ is
+# imported as a package, a top-level one when run as a script or with src/
+# on sys.path
+try:
+    from ._sim_numba import NUMBA_THRESHOLD, UNITS_CODES, sim_core as _sim_core
+except ImportError:
+    try:
+        from _sim_numba import NUMBA_THRESHOLD, UNITS_CODES, sim_core as _sim_core
+    except ImportError:  # kernel module not shipped: batches stay on NumPy
+        NUMBA_THRESHOLD = 500
+        UNITS_CODES = {"celsius": 0, "fahrenheit": 1, "kelvin": 2}
+        _sim_core = None
+
 # Configure logging for the agent
 logging.basicConfig(
     level=logging.INFO,
@@ -22,8 +56,67 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Patterns for pulling a location out of phrases like "weather in [location]"
+_LOCATION_PATTERNS = [
+    re.compile(pattern) for pattern in (
+        r"weather (?:in|for|at) ([^?]+)",
+        r"temperature (?:in|for|at) ([^?]+)",
+        r"forecast (?:in|for|at) ([^?]+)",
+        r"what'?s (?:the )?weather (?:like )?(?:in|for|at) ([^?]+)",
+    )
+]
+_LOCATION_FILLER_RE = re.compile(r'\b(like|today|now|currently)\b')
+_PUNCTUATION_RE = re.compile(r'[?!.,]')
+
+def _base_temperature(location: str) -> int:
+    """Return the simulated base temperature in Celsius for a location."""
+    location_lower = location.lower()
+    if "arctic" in location_lower or "alaska" in location_lower:
+        return -10
+    elif "desert" in location_lower or "sahara" in location_lower:
+        return 35
+    elif "tropical" in location_lower or "hawaii" in location_lower:
+        return 28
+    return 20
+
+
+# Tokenizer and filler words for indexing memory for context retrieval
+_TOKEN_RE = re.compile(r"\w+")
+_CONTEXT_STOPWORDS = frozenset({
+    "an", "and", "are", "at", "can", "for", "in", "is", "it", "me",
+    "of", "the", "this", "to", "what", "with", "you",
+})
+
+
+def _content_tokens(text: str) -> frozenset:
+    """Return the distinct lower-cased content tokens in ``text``."""
+    return frozenset(
+        token for token in _TOKEN_RE.findall(text.lower())
+        if len(token) > 1 and token not in _CONTEXT_STOPWORDS
+    )
 
-@dataclass
+
+# Random source and condition labels for the simulated weather API
+_RNG = random.Random()
+_CONDITIONS = ("sunny", "cloudy", "partly cloudy", "rainy", "stormy")
+
+# Keyword groups used to route user input, matched on whole words
+_INTENT_RE = re.compile(
+    r'\b(?:'
+    r'(?P<help>help|commands|what can you do)'
+    r'|(?P<weather>weather|temperature|forecast)'
+    r'|(?P<greeting>hello|hi|hey|good morning|good afternoon)'
+    r')\b'
+)
+# When several intents appear in one message, the earliest listed wins
+_INTENT_PRIORITY = ("help", "weather", "greeting")
+_FAHRENHEIT_RE = re.compile(r'\bfahrenheit\b|°f\b|\bf\b')
+_KELVIN_RE = re.compile(r'\b(?:kelvin|k)\b')
+_WEATHER_WORDS = frozenset({"weather", "temperature", "forecast"})
+_QUIT_COMMANDS = frozenset({"quit", "exit", "bye", "q"})
+
+
+@dataclass(slots=True, frozen=True)
 class AgentConfig:
     """Configuration class for the weather agent."""
     name: str = "weather-agent"
@@ -34,21 +127,106 @@ class AgentConfig:
     log_level: str = "INFO"
 
 
+# Python types accepted for each JSON schema "type"
+_SCHEMA_TYPES: Dict[str, Tuple[type, ...]] = {
+    "string": (str,),
+    "number": (int, float),
+    "integer": (int,),
+    "boolean": (bool,),
+    "object": (dict,),
+    "array": (list, tuple),
+}
+
+
+def compile_validator(parameters: Mapping[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """Compile an object parameter schema into a fast validation function.
+    
+    Supports the subset of JSON schema used by tool definitions: ``required``
+    plus per-property ``type``, ``enum`` and ``pattern``. The returned
+    function takes the keyword arguments as a dict and returns True if valid.
+    """
+    required = tuple(parameters.get("required", ()))
+    checks = []
+    for name, spec in parameters.get("properties", {}).items():
+        types = _SCHEMA_TYPES.get(spec.get("type"))
+        enum = frozenset(spec["enum"]) if "enum" in spec else None
+        pattern = re.compile(spec["pattern"]) if "pattern" in spec else None
+        checks.append((name, types, enum, pattern))
+    
+    def validate(kwargs: Dict[str, Any]) -> bool:
+        for name in required:
+            if name not in kwargs:
+                return False
+        for name, types, enum, pattern in checks:
+            if name not in kwargs:
+                continue
+            value = kwargs[name]
+            if types is not None and not isinstance(value, types):
+                return False
+            if isinstance(value, bool) and types is not None and bool not in types:
+                return False  # bool is an int subclass but not a JSON number
+            if enum is not None and value not in enum:
+                return False
+            if pattern is not None and isinstance(value, str) and not pattern.search(value):
+                return False
+        return True
+    
+    return validate
+
+
 class Tool:
     """Base class for agent tools."""
     
+    __slots__ = ("name", "description", "logger", "_validator", "_executor")
+    
+    # Worker threads for the default execute_async
+    MAX_WORKERS = 4
+    
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
         self.logger = logging.getLogger(f"{__name__}.{name}")
+        self._validator: Optional[Callable[[Dict[str, Any]], bool]] = None
+        # Created on first async call and kept until aclose(), so threads are
+        # reused across calls and event loops
+        self._executor: Optional[ThreadPoolExecutor] = None
     
     def execute(self, **kwargs) -> Dict[str, Any]:
         """Execute the tool with given parameters."""
         raise NotImplementedError("Subclasses must implement execute method")
     
+    async def execute_async(self, **kwargs) -> Dict[str, Any]:
+        """Execute the tool without blocking the event loop.
+        
+        Tools backed by an async client should override this; the default
+        runs the synchronous ``execute`` on the tool's worker pool.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.MAX_WORKERS, thread_name_prefix=self.name
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(self.execute, **kwargs))
+    
+    async def aclose(self) -> None:
+        """Release long-lived resources: the worker pool, or a pooled client.
+        
+        Tools that keep a client open across calls should create it lazily
+        on first use and close it here, after calling this base method.
+        """
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            # Waiting for running calls blocks, so keep it off the loop
+            await asyncio.to_thread(executor.shutdown)
+    
     def validate_input(self, **kwargs) -> bool:
-        """Validate input parameters for the tool."""
-        return True
+        """Validate input parameters against the tool's parameter schema.
+        
+        The schema is compiled into a validator on first use and reused.
+        """
+        if self._validator is None:
+            self._validator = compile_validator(self.get_schema()["parameters"])
+        return self._validator(kwargs)
     
     def get_schema(self) -> Dict[str, Any]:
         """Return the input/output schema for this tool."""
@@ -63,67 +241,64 @@ class Tool:
 class WeatherAPITool(Tool):
     """Tool for retrieving weather information from a weather API."""
     
-    def __init__(self):
-        super().__init__(
-            name="weather_api",
-            description="Retrieves current weather information for a specified location"
-        )
+    __slots__ = ("_cache", "_cache_lock")
     
-    def get_schema(self) -> Dict[str, Any]:
-        """Return the input/output schema for the weather API tool."""
-        return {
-            "name": self.name,
-            "description": self.description,
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "location": {
-                        "type": "string",
-                        "description": "The city name or location to get weather for",
-                        "required": True
-                    },
-                    "units": {
-                        "type": "string",
-                        "description": "Temperature units (celsius, fahrenheit, kelvin)",
-                        "default": "celsius",
-                        "enum": ["celsius", "fahrenheit", "kelvin"]
-                    }
+    # Built once for the class; callers must treat it as read-only
+    _SCHEMA: Dict[str, Any] = {
+        "name": "weather_api",
+        "description": "Retrieves current weather information for a specified location",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "location": {
+                    "type": "string",
+                    "description": "The city name or location to get weather for",
+                    "pattern": r"\S",
+                    "required": True
                 },
-                "required": ["location"]
-            },
-            "returns": {
-                "type": "object",
-                "properties": {
-                    "success": {"type": "boolean"},
-                    "data": {
-                        "type": "object",
-                        "properties": {
-                            "location": {"type": "string"},
-                            "temperature": {"type": "number"},
-                            "description": {"type": "string"},
-                            "humidity": {"type": "number"},
-                            "wind_speed": {"type": "number"}
-                        }
-                    },
-                    "error": {"type": "string"}
+                "units": {
+                    "type": "string",
+                    "description": "Temperature units (celsius, fahrenheit, kelvin)",
+                    "default": "celsius",
+                    "enum": ["celsius", "fahrenheit", "kelvin"]
                 }
+            },
+            "required": ["location"]
+        },
+        "returns": {
+            "type": "object",
+            "properties": {
+                "success": {"type": "boolean"},
+                "data": {
+                    "type": "object",
+                    "properties": {
+                        "location": {"type": "string"},
+                        "temperature": {"type": "number"},
+                        "description": {"type": "string"},
+                        "humidity": {"type": "number"},
+                        "wind_speed": {"type": "number"}
+                    }
+                },
+                "error": {"type": "string"}
             }
         }
+    }
     
-    def validate_input(self, **kwargs) -> bool:
-        """Validate input parameters."""
-        if "location" not in kwargs:
-            return False
-        
-        location = kwargs["location"]
-        if not isinstance(location, str) or len(location.strip()) == 0:
-            return False
-        
-        units = kwargs.get("units", "celsius")
-        if units not in ["celsius", "fahrenheit", "kelvin"]:
-            return False
-        
-        return True
+    # Recent results are reused per (location, units) for a short while
+    CACHE_SIZE = 256
+    CACHE_TTL = 300.0  # seconds
+    
+    def __init__(self):
+        super().__init__(
+            name=self._SCHEMA["name"],
+            description=self._SCHEMA["description"]
+        )
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    def get_schema(self) -> Dict[str, Any]:
+        """Return the input/output schema for the weather API tool."""
+        return self._SCHEMA
     
     def execute(self, **kwargs) -> Dict[str, Any]:
         """Execute the weather API call."""
@@ -137,14 +312,19 @@ class WeatherAPITool(Tool):
             location = kwargs["location"].strip()
             units = kwargs.get("units", "celsius")
             
-            self.logger.info(f"Fetching weather for {location} in {units}")
+            cache_key = (location.lower(), units)
+            weather_data = self._get_cached(cache_key)
             
-            # Simulate API call (in real implementation, this would call an actual weather API)
-            weather_data = self._simulate_weather_api(location, units)
+            if weather_data is None:
+                self.logger.info("Fetching weather for %s in %s", location, units)
+                
+                # Simulate API call (in real implementation, this would call an actual weather API)
+                weather_data = self._simulate_weather_api(location, units)
+                self._put_cached(cache_key, weather_data)
             
             return {
                 "success": True,
-                "data": weather_data,
+                "data": dict(weather_data),
                 "metadata": {
                     "tool": self.name,
                     "timestamp": datetime.now().isoformat(),
@@ -161,21 +341,82 @@ class WeatherAPITool(Tool):
                 "error": error_msg
             }
     
+    def _get_cached(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        """Return cached weather data for ``key`` if it has not expired."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            
+            stored_at, weather_data = entry
+            if time.monotonic() - stored_at > self.CACHE_TTL:
+                del self._cache[key]
+                return None
+            
+            self._cache.move_to_end(key)
+            return weather_data
+    
+    def _put_cached(self, key: Tuple[str, str], weather_data: Dict[str, Any]):
+        """Cache weather data, evicting the least recently used entry when full."""
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), weather_data)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+    
+    def simulate_batch(self, locations: List[str], units: str = "celsius") -> List[Dict[str, Any]]:
+        """Simulate weather for many locations at once.
+        
+        Intended for load tests and backfills. With NumPy installed all
+        random draws and unit conversions are vectorized; otherwise each
+        location goes through ``_simulate_weather_api``. Batches larger than
+        ``NUMBA_THRESHOLD`` use the compiled kernel when Numba is installed.
+        """
+        if np is None:
+            return [self._simulate_weather_api(location, units) for location in locations]
+        
+        count = len(locations)
+        rng = np.random.default_rng()
+        
+        base_temps = np.fromiter((_base_temperature(location) for location in locations), dtype=float, count=count)
+        if _sim_core is not None and count > NUMBA_THRESHOLD:
+            seed = int(rng.integers(2**31))
+            temperatures = _sim_core(base_temps, UNITS_CODES.get(units, 0), seed)
+        else:
+            temperatures = base_temps + rng.integers(-5, 6, size=count)
+            if units == "fahrenheit":
+                temperatures = temperatures * 9 / 5 + 32
+            elif units == "kelvin":
+                temperatures = temperatures + 273.15
+        
+        conditions = rng.integers(0, len(_CONDITIONS), size=count).tolist()
+        humidity = rng.integers(30, 91, size=count).tolist()
+        wind_speeds = np.round(rng.uniform(0, 25, size=count), 1).tolist()
+        
+        return [
+            {
+                "location": location,
+                "temperature": temperature,
+                "description": _CONDITIONS[condition],
+                "humidity": hum,
+                "wind_speed": wind_speed,
+                "units": units
+            }
+            for location, temperature, condition, hum, wind_speed in zip(
+                locations, np.round(temperatures, 1).tolist(), conditions, humidity, wind_speeds
+            )
+        ]
+    
     def _simulate_weather_api(self, location: str, units: str) -> Dict[str, Any]:
         """Simulate a weather API response."""
         # In a real implementation, this would make an HTTP request to a weather service
-        import random
+        rand = _RNG.random
         
         # Simulate different weather conditions based on location
-        base_temp = 20  # Celsius
-        if "arctic" in location.lower() or "alaska" in location.lower():
-            base_temp = -10
-        elif "desert" in location.lower() or "sahara" in location.lower():
-            base_temp = 35
-        elif "tropical" in location.lower() or "hawaii" in location.lower():
-            base_temp = 28
+        base_temp = _base_temperature(location)
         
-        temperature = base_temp + random.randint(-5, 5)
+        # Scale random.random() directly; randint's rejection sampling is slower
+        temperature = base_temp + int(rand() * 11) - 5
         
         # Convert temperature based on units
         if units == "fahrenheit":
@@ -183,54 +424,111 @@ class WeatherAPITool(Tool):
         elif units == "kelvin":
             temperature = temperature + 273.15
         
-        conditions = ["sunny", "cloudy", "partly cloudy", "rainy", "stormy"]
-        
         return {
             "location": location,
             "temperature": round(temperature, 1),
-            "description": random.choice(conditions),
-            "humidity": random.randint(30, 90),
-            "wind_speed": round(random.uniform(0, 25), 1),
+            "description": _CONDITIONS[int(rand() * len(_CONDITIONS))],
+            "humidity": 30 + int(rand() * 61),
+            "wind_speed": round(rand() * 25, 1),
             "units": units
         }
 
 
 class AgentMemory:
-    """Simple memory system for the agent."""
+    """Simple memory system for the agent.
+    
+    History and tool results are bounded, so the oldest entries are dropped
+    once a long-running session exceeds the limits below. ``get_context``
+    can also pull relevant older messages back in by content tokens; they
+    are only extracted once a query asks for them.
+    """
+    
+    __slots__ = ("conversation_history", "context", "tool_results", "_message_tokens")
+    
+    MAX_MESSAGES = 200
+    MAX_TOOL_RESULTS = 50
     
     def __init__(self):
-        self.conversation_history: List[Dict[str, Any]] = []
+        self.conversation_history: Deque[Dict[str, Any]] = deque(maxlen=self.MAX_MESSAGES)
         self.context: Dict[str, Any] = {}
-        self.tool_results: List[Dict[str, Any]] = []
+        self.tool_results: Deque[Dict[str, Any]] = deque(maxlen=self.MAX_TOOL_RESULTS)
+        # id(message) -> (message, its content tokens), filled in by queries;
+        # holding the message keeps its id from being reused while cached
+        self._message_tokens: Dict[int, Tuple[Dict[str, Any], frozenset]] = {}
     
-    def add_message(self, role: str, content: str, metadata: Optional[Dict] = None):
-        """Add a message to the conversation history."""
+    def add_message(self, role: str, content: str, metadata: Optional[Dict] = None,
+                    timestamp: Optional[str] = None):
+        """Add a message to the conversation history.
+        
+        ``timestamp`` lets callers share one ISO timestamp across a turn.
+        """
         message = {
             "role": role,
             "content": content,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp or datetime.now().isoformat(),
             "metadata": metadata or {}
         }
         self.conversation_history.append(message)
-        logger.debug(f"Added message: {role} - {content[:100]}...")
+        logger.debug("Added message: %s - %.100s...", role, content)
     
-    def add_tool_result(self, tool_name: str, result: Dict[str, Any]):
+    def add_tool_result(self, tool_name: str, result: Dict[str, Any],
+                        timestamp: Optional[str] = None):
         """Add a tool execution result to memory."""
         tool_result = {
             "tool": tool_name,
             "result": result,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp or datetime.now().isoformat()
         }
         self.tool_results.append(tool_result)
-        logger.debug(f"Added tool result: {tool_name}")
+        logger.debug("Added tool result: %s", tool_name)
     
-    def get_context(self) -> Dict[str, Any]:
-        """Get the current context for the agent."""
+    def get_context(self, query: Optional[str] = None, top_k: int = 5) -> Dict[str, Any]:
+        """Get the current context for the agent.
+        
+        With a ``query``, the history holds the ``top_k`` retained messages
+        sharing the most content tokens with it, oldest first. Without one, or
+        when nothing matches, it falls back to the last 5 messages.
+        """
+        history = None
+        if query:
+            history = self._search(query, top_k)
         return {
-            "conversation_history": self.conversation_history[-5:],  # Last 5 messages
+            "conversation_history": history or self._tail(self.conversation_history, 5),  # Last 5 messages
             "context": self.context,
-            "recent_tool_results": self.tool_results[-3:]  # Last 3 tool results
+            "recent_tool_results": self._tail(self.tool_results, 3)  # Last 3 tool results
         }
+    
+    def _search(self, query: str, top_k: int) -> List[Dict[str, Any]]:
+        """Return up to ``top_k`` messages ranked by shared tokens, then recency."""
+        query_tokens = _content_tokens(query)
+        if not query_tokens:
+            return []
+        
+        # Walk the history as it is now, so edits made to it directly are
+        # picked up; tokens are reused for messages seen by earlier queries
+        cached = self._message_tokens
+        current: Dict[int, Tuple[Dict[str, Any], frozenset]] = {}
+        scored: List[Tuple[int, int]] = []
+        for position, message in enumerate(self.conversation_history):
+            entry = cached.get(id(message))
+            if entry is None or entry[0] is not message:
+                entry = (message, _content_tokens(message["content"]))
+            current[id(message)] = entry
+            score = len(query_tokens & entry[1])
+            if score:
+                scored.append((score, position))
+        self._message_tokens = current
+        if not scored:
+            return []
+        
+        best = sorted(scored, reverse=True)[:top_k]
+        history = self.conversation_history
+        return [history[position] for position in sorted(position for _score, position in best)]
+    
+    @staticmethod
+    def _tail(items: Deque[Dict[str, Any]], count: int) -> List[Dict[str, Any]]:
+        """Return the last ``count`` entries without copying the whole deque."""
+        return list(islice(items, max(0, len(items) - count), None))
 
 
 class WeatherAgent:
@@ -245,12 +543,25 @@ class WeatherAgent:
     - Clear documentation
     """
     
+    __slots__ = (
+        "config", "memory", "tools", "iteration_count", "is_running", "logger",
+        "_turn_ts", "_intent_handlers"
+    )
+    
     def __init__(self, config: Optional[AgentConfig] = None):
         self.config = config or AgentConfig()
         self.memory = AgentMemory()
         self.tools: Dict[str, Tool] = {}
         self.iteration_count = 0
         self.is_running = False
+        # Timestamp shared by everything recorded during the current turn
+        self._turn_ts: Optional[str] = None
+        # Response handlers keyed by the intent names in _INTENT_RE
+        self._intent_handlers = {
+            "help": self._handle_help_request,
+            "weather": self._handle_weather_request,
+            "greeting": self._handle_greeting,
+        }
         
         # Set up logging
         self.logger = logging.getLogger(f"{__name__}.{self.config.name}")
@@ -259,7 +570,17 @@ class WeatherAgent:
         # Initialize tools
         self._initialize_tools()
         
-        self.logger.info(f"Initialized {self.config.name} v{self.config.version}")
+        self.logger.info("Initialized %s v%s", self.config.name, self.config.version)
+    
+    async def __aenter__(self) -> "WeatherAgent":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close every tool so shared connections are released once per session."""
+        await asyncio.gather(*(tool.aclose() for tool in self.tools.values()))
     
     def _initialize_tools(self):
         """Initialize all tools for this agent."""
@@ -268,48 +589,86 @@ class WeatherAgent:
     def add_tool(self, tool: Tool):
         """Add a tool to the agent's toolkit."""
         self.tools[tool.name] = tool
-        self.logger.info(f"Added tool: {tool.name}")
+        self.logger.info("Added tool: %s", tool.name)
     
     def execute_tool(self, tool_name: str, **kwargs) -> Dict[str, Any]:
         """Execute a specific tool with error handling."""
         if tool_name not in self.tools:
-            error_msg = f"Tool '{tool_name}' not found. Available tools: {list(self.tools.keys())}"
-            self.logger.error(error_msg)
-            return {"error": error_msg, "success": False}
+            return self._tool_not_found(tool_name)
         
         tool = self.tools[tool_name]
         
         try:
-            self.logger.info(f"Executing tool: {tool_name}")
+            self.logger.info("Executing tool: %s", tool_name)
             result = tool.execute(**kwargs)
+            return self._record_tool_result(tool_name, result)
             
-            # Add result to memory
-            self.memory.add_tool_result(tool_name, result)
-            
-            # Ensure result has success flag
-            if "success" not in result:
-                result["success"] = True
-            
-            self.logger.info(f"Tool '{tool_name}' executed successfully")
-            return result
+        except Exception as e:
+            return self._tool_error(tool_name, e)
+    
+    async def execute_tool_async(self, tool_name: str, **kwargs) -> Dict[str, Any]:
+        """Execute a specific tool via its async entry point, with error handling."""
+        if tool_name not in self.tools:
+            return self._tool_not_found(tool_name)
+        
+        tool = self.tools[tool_name]
+        
+        try:
+            self.logger.info("Executing tool: %s", tool_name)
+            result = await tool.execute_async(**kwargs)
+            return self._record_tool_result(tool_name, result)
             
         except Exception as e:
-            error_msg = f"Error executing tool '{tool_name}': {str(e)}"
-            self.logger.error(error_msg, exc_info=True)
-            return {"error": error_msg, "success": False}
+            return self._tool_error(tool_name, e)
+    
+    async def execute_tools(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Execute several tool calls concurrently.
+        
+        Results are returned in the same order as ``calls``.
+        """
+        return await asyncio.gather(
+            *(self.execute_tool_async(tool_name, **kwargs) for tool_name, kwargs in calls)
+        )
+    
+    def _record_tool_result(self, tool_name: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a tool result in memory and make sure it carries a success flag."""
+        # Add result to memory
+        self.memory.add_tool_result(tool_name, result, timestamp=self._turn_ts)
+        
+        # Ensure result has success flag
+        if "success" not in result:
+            result["success"] = True
+        
+        self.logger.info("Tool '%s' executed successfully", tool_name)
+        return result
+    
+    def _tool_not_found(self, tool_name: str) -> Dict[str, Any]:
+        """Build the error result for an unknown tool."""
+        error_msg = f"Tool '{tool_name}' not found. Available tools: {list(self.tools.keys())}"
+        self.logger.error(error_msg)
+        return {"error": error_msg, "success": False}
+    
+    def _tool_error(self, tool_name: str, error: Exception) -> Dict[str, Any]:
+        """Build the error result for a tool that raised."""
+        error_msg = f"Error executing tool '{tool_name}': {str(error)}"
+        self.logger.error(error_msg, exc_info=True)
+        return {"error": error_msg, "success": False}
     
     def process_user_input(self, user_input: str) -> str:
         """Process user input and return a response."""
-        self.logger.info(f"Processing user input: {user_input[:100]}...")
+        self.logger.info("Processing user input: %.100s...", user_input)
+        
+        self._turn_ts = datetime.now().isoformat()
+        lowered = user_input.lower()
         
         # Add user message to memory
-        self.memory.add_message("user", user_input)
+        self.memory.add_message("user", user_input, timestamp=self._turn_ts)
         
         try:
-            response = self._generate_response(user_input)
+            response = self._generate_response(user_input, lowered)
             
             # Add agent response to memory
-            self.memory.add_message("assistant", response)
+            self.memory.add_message("assistant", response, timestamp=self._turn_ts)
             
             return response
             
@@ -317,39 +676,52 @@ class WeatherAgent:
             error_msg = f"Error processing user input: {str(e)}"
             self.logger.error(error_msg, exc_info=True)
             return f"I apologize, but I encountered an error: {error_msg}"
-    
-    def _generate_response(self, user_input: str) -> str:
-        """Generate a response based on user input and current context."""
-        user_input_lower = user_input.lower()
         
-        # Handle help requests
-        if any(word in user_input_lower for word in ["help", "what can you do", "commands"]):
-            return self._get_help_message()
+        finally:
+            self._turn_ts = None
+    
+    def _generate_response(self, user_input: str, lowered: Optional[str] = None) -> str:
+        """Generate a response based on user input and current context.
         
-        # Handle weather requests
-        if any(word in user_input_lower for word in ["weather", "temperature", "forecast"]):
-            return self._handle_weather_request(user_input)
+        ``lowered`` is the lowercased input, computed once per turn and shared
+        with the handlers.
+        """
+        if lowered is None:
+            lowered = user_input.lower()
         
-        # Handle greetings
-        if any(word in user_input_lower for word in ["hello", "hi", "hey", "good morning", "good afternoon"]):
-            return "Hello! I'm the Weather Agent. I can help you get current weather information for any location. Just ask me about the weather in a specific city or location!"
+        # Collect every intent mentioned in a single scan of the input
+        intents = {match.lastgroup for match in _INTENT_RE.finditer(lowered)}
+        for intent in _INTENT_PRIORITY:
+            if intent in intents:
+                return self._intent_handlers[intent](user_input, lowered)
         
         # Default response
         return "I'm a weather agent that can provide current weather information. Try asking me something like 'What's the weather in New York?' or type 'help' for more information."
     
-    def _handle_weather_request(self, user_input: str) -> str:
+    def _handle_help_request(self, user_input: str, lowered: str) -> str:
+        """Handle help requests."""
+        return self._get_help_message()
+    
+    def _handle_greeting(self, user_input: str, lowered: str) -> str:
+        """Handle greetings."""
+        return "Hello! I'm the Weather Agent. I can help you get current weather information for any location. Just ask me about the weather in a specific city or location!"
+    
+    def _handle_weather_request(self, user_input: str, lowered: Optional[str] = None) -> str:
         """Handle weather-related requests."""
+        if lowered is None:
+            lowered = user_input.lower()
+        
         # Simple location extraction (in a real implementation, this would be more sophisticated)
-        location = self._extract_location(user_input)
+        location = self._extract_location(user_input, lowered)
         
         if not location:
             return "I'd be happy to help you with weather information! Please specify a location, for example: 'What's the weather in London?' or 'Tell me the weather in Tokyo'."
         
         # Extract units preference if mentioned
         units = "celsius"
-        if any(word in user_input.lower() for word in ["fahrenheit", "°f", "f"]):
+        if _FAHRENHEIT_RE.search(lowered):
             units = "fahrenheit"
-        elif any(word in user_input.lower() for word in ["kelvin", "k"]):
+        elif _KELVIN_RE.search(lowered):
             units = "kelvin"
         
         # Execute weather tool
@@ -362,25 +734,19 @@ class WeatherAgent:
             error = result.get("error", "Unknown error occurred")
             return f"I'm sorry, I couldn't retrieve the weather information for {location}. Error: {error}"
     
-    def _extract_location(self, user_input: str) -> Optional[str]:
+    def _extract_location(self, user_input: str, lowered: Optional[str] = None) -> Optional[str]:
         """Extract location from user input."""
         # Simple location extraction - in a real implementation, this would use NLP
-        import re
+        if lowered is None:
+            lowered = user_input.lower()
         
         # Look for patterns like "weather in [location]" or "weather for [location]"
-        patterns = [
-            r"weather (?:in|for|at) ([^?]+)",
-            r"temperature (?:in|for|at) ([^?]+)",
-            r"forecast (?:in|for|at) ([^?]+)",
-            r"what'?s (?:the )?weather (?:like )?(?:in|for|at) ([^?]+)",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, user_input.lower())
+        for pattern in _LOCATION_PATTERNS:
+            match = pattern.search(lowered)
             if match:
                 location = match.group(1).strip()
                 # Clean up common words
-                location = re.sub(r'\b(like|today|now|currently)\b', '', location).strip()
+                location = _LOCATION_FILLER_RE.sub('', location).strip()
                 if location:
                     return location
         
@@ -388,8 +754,8 @@ class WeatherAgent:
         words = user_input.split()
         # This is a very basic approach - in reality, you'd use a proper NER system
         potential_locations = []
-        for i, word in enumerate(words):
-            if word.lower() in ["weather", "temperature", "forecast"]:
+        for i, word in enumerate(lowered.split()):
+            if word in _WEATHER_WORDS:
                 # Look for the next few words as potential location
                 if i + 1 < len(words):
                     potential_locations.extend(words[i+1:i+4])
@@ -397,7 +763,7 @@ class WeatherAgent:
         if potential_locations:
             # Join and clean up
             location = " ".join(potential_locations)
-            location = re.sub(r'[?!.,]', '', location).strip()
+            location = _PUNCTUATION_RE.sub('', location).strip()
             if len(location) > 2:  # Basic validation
                 return location
         
@@ -419,75 +785,102 @@ class WeatherAgent:
         elif units == "kelvin":
             temp_unit = "K"
         
-        response = f"🌤️ Weather in {location}:\n"
-        response += f"Temperature: {temp}{temp_unit}\n"
-        response += f"Conditions: {description.title()}\n"
-        response += f"Humidity: {humidity}%\n"
-        response += f"Wind Speed: {wind_speed} km/h"
-        
-        return response
+        return (
+            f"🌤️ Weather in {location}:\n"
+            f"Temperature: {temp}{temp_unit}\n"
+            f"Conditions: {description.title()}\n"
+            f"Humidity: {humidity}%\n"
+            f"Wind Speed: {wind_speed} km/h"
+        )
     
     def _get_help_message(self) -> str:
         """Generate a help message listing available capabilities."""
-        help_msg = f"🤖 {self.config.name} v{self.config.version}\n"
-        help_msg += f"{self.config.description}\n\n"
-        help_msg += "I can help you with:\n"
-        help_msg += "• Current weather information for any city or location\n"
-        help_msg += "• Temperature in Celsius, Fahrenheit, or Kelvin\n"
-        help_msg += "• Weather conditions, humidity, and wind speed\n\n"
-        help_msg += "Example commands:\n"
-        help_msg += "• 'What's the weather in London?'\n"
-        help_msg += "• 'Tell me the temperature in Tokyo in Fahrenheit'\n"
-        help_msg += "• 'Weather forecast for New York'\n\n"
-        help_msg += "Available tools:\n"
-        
-        for tool_name, tool in self.tools.items():
-            help_msg += f"• {tool_name}: {tool.description}\n"
-        
-        return help_msg
+        parts = [
+            f"🤖 {self.config.name} v{self.config.version}",
+            f"{self.config.description}\n",
+            "I can help you with:",
+            "• Current weather information for any city or location",
+            "• Temperature in Celsius, Fahrenheit, or Kelvin",
+            "• Weather conditions, humidity, and wind speed\n",
+            "Example commands:",
+            "• 'What's the weather in London?'",
+            "• 'Tell me the temperature in Tokyo in Fahrenheit'",
+            "• 'Weather forecast for New York'\n",
+            "Available tools:",
+        ]
+        parts.extend(f"• {tool_name}: {tool.description}" for tool_name, tool in self.tools.items())
+        parts.append("")  # Keep the trailing newline
+        
+        return "\n".join(parts)
     
     def run_interactive_session(self):
         """Run an interactive session with the user."""
         self.logger.info("Starting interactive session")
         self.is_running = True
         
-        print(f"🌤️ Welcome to {self.config.name}!")
-        print(f"{self.config.description}")
-        print("Type 'quit', 'exit', or 'bye' to end the session.")
-        print("Type 'help' to see what I can do.\n")
+        write = sys.stdout.write
+        write(
+            f"🌤️ Welcome to {self.config.name}!\n"
+            f"{self.config.description}\n"
+            "Type 'quit', 'exit', or 'bye' to end the session.\n"
+            "Type 'help' to see what I can do.\n\n"
+        )
         
         try:
             while self.is_running and self.iteration_count < self.config.max_iterations:
-                user_input = input("You: ").strip()
+                line = self._read_line("You: ")
+                if line is None:
+                    break
+                user_input = line.strip()
                 
-                if user_input.lower() in ['quit', 'exit', 'bye']:
-                    print("Weather Agent: Goodbye! Stay safe and have a great day! 🌈")
+                if user_input.lower() in _QUIT_COMMANDS:
+                    write("Weather Agent: Goodbye! Stay safe and have a great day! 🌈\n")
                     break
                 
                 if not user_input:
                     continue
                 
                 response = self.process_user_input(user_input)
-                print(f"\nWeather Agent: {response}\n")
+                write(f"\nWeather Agent: {response}\n\n")
                 
                 self.iteration_count += 1
                 
                 # Human-in-the-loop checkpoint
                 if self.config.enable_human_feedback and self.iteration_count % 5 == 0:
-                    feedback = input("How am I doing? (Press Enter to continue): ").strip()
+                    feedback = (self._read_line("How am I doing? (Press Enter to continue): ") or "").strip()
                     if feedback:
                         self.memory.add_message("feedback", feedback)
-                        print("Thank you for the feedback! I'll keep improving. 😊\n")
+                        write("Thank you for the feedback! I'll keep improving. 😊\n\n")
         
         except KeyboardInterrupt:
-            print("\n\nWeather Agent: Session interrupted. Goodbye! 👋")
+            write("\n\nWeather Agent: Session interrupted. Goodbye! 👋\n")
         except Exception as e:
-            self.logger.error(f"Error in interactive session: {str(e)}", exc_info=True)
-            print(f"An error occurred: {str(e)}")
+            self.logger.error("Error in interactive session: %s", e, exc_info=True)
+            write(f"An error occurred: {str(e)}\n")
         finally:
+            sys.stdout.flush()
             self.is_running = False
             self.logger.info("Interactive session ended")
     
+    @staticmethod
+    def _read_line(prompt: str) -> Optional[str]:
+        """Prompt for one line of input, returning None at end of input.
+        
+        Terminals keep ``input()`` for line editing; piped stdin (scripted
+        conversation replay) is read with ``readline`` and stdout is only
+        flushed once per turn, when the prompt is shown.
+        """
+        if sys.stdin.isatty():
+            try:
+                return input(prompt)
+            except EOFError:
+                return None
+        
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        return line if line else None
+    
     def get_status(self) -> Dict[str, Any]:
         """Get the current status of the agent."""
         return {
@@ -507,12 +900,31 @@ class WeatherAgent:
                 "version": self.config.version,
                 "description": self.config.description
             },
-            "conversation_history": self.memory.conversation_history,
-            "tool_results": self.memory.tool_results,
+            "conversation_history": list(self.memory.conversation_history),
+            "tool_results": list(self.memory.tool_results),
             "status": self.get_status()
         }
 
 
+def dump_json(data: Dict[str, Any]) -> bytes:
+    """Serialize data as indented UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+async def _finish_session(agent: "WeatherAgent", config: AgentConfig):
+    """Close the agent's tools and export the conversation for review."""
+    async with agent:
+        conversation_data = agent.export_conversation()
+    
+    # Export conversation for review without blocking the loop on disk I/O
+    filename = f"{config.name}_conversation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    await asyncio.to_thread(Path(filename).write_bytes, dump_json(conversation_data))
+    
+    print(f"Conversation exported to {filename}")
+
+
 def main():
     """Main function to run the weather agent."""
     # Create agent configuration
@@ -521,16 +933,11 @@ def main():
     # Initialize the agent
     agent = WeatherAgent(config)
     
-    # Run interactive session
+    # Run interactive session before starting the event loop: under
+    # asyncio.run, Ctrl-C cancels the main task instead of interrupting input()
     agent.run_interactive_session()
     
-    # Export conversation for review
-    conversation_data = agent.export_conversation()
-    filename = f"{config.name}_conversation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(filename, "w") as f:
-        json.dump(conversation_data, f, indent=2)
-    
-    print(f"Conversation exported to {filename}")
+    asyncio.run(_finish_session(agent, config))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Shared fixtures for the Weather Agent test suite
+
+Read-only agent and tool instances are built once per session; tests that
+mutate state or count exact memory entries ask for a fresh instance instead.
+
+Author: Agent-Builder Framework
+Created: 2025-09-20
+"""
+
+import logging
+import os
+import sys
+
+import pytest
+
+try:
+    import pytest_benchmark
+except ImportError:  # optional: timing for the performance tests
+    pytest_benchmark = None
+
+# Add the src directory to the path so we can import the agent
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from agent import WeatherAgent, AgentConfig, WeatherAPITool, AgentMemory
+
+
+def pytest_configure(config):
+    """Register the custom markers used by this suite."""
+    config.addinivalue_line("markers", "real_sim: run the real weather simulation instead of canned data")
+    config.addinivalue_line("markers", "benchmark: performance tests, only run with -m benchmark")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Leave performance tests out unless a -m expression asks for them."""
+    if config.option.markexpr:
+        return
+    selected = [item for item in items if "benchmark" not in item.keywords]
+    if len(selected) < len(items):
+        config.hook.pytest_deselected(items=[item for item in items if "benchmark" in item.keywords])
+        items[:] = selected
+
+
+def _canned_weather(self, location: str, units: str):
+    """Fixed weather data used in place of the simulated API."""
+    return {
+        "location": location,
+        "temperature": 20.0,
+        "description": "sunny",
+        "humidity": 50,
+        "wind_speed": 5.0,
+        "units": units
+    }
+
+
+@pytest.fixture(autouse=True)
+def _quiet(caplog):
+    """Silence the agent's loggers below CRITICAL for the duration of each test."""
+    caplog.set_level(logging.CRITICAL, logger="agent")
+
+
+@pytest.fixture(autouse=True)
+def fast_sim(monkeypatch, request):
+    """Serve canned weather data unless a test is marked ``real_sim``."""
+    if "real_sim" in request.keywords:
+        return
+    monkeypatch.setattr(WeatherAPITool, "_simulate_weather_api", _canned_weather)
+
+
+@pytest.fixture(scope="session")
+def mock_config() -> AgentConfig:
+    """Create a mock configuration for testing."""
+    return AgentConfig(
+        name="test_weather_agent",
+        description="Test weather agent for unit testing",
+        version="1.0.0",
+        max_iterations=5,
+        enable_human_feedback=False,
+        log_level="CRITICAL"
+    )
+
+
+@pytest.fixture(scope="session")
+def shared_agent(mock_config) -> WeatherAgent:
+    """Agent shared by tests that do not depend on its state."""
+    return WeatherAgent(mock_config)
+
+
+@pytest.fixture
+def fresh_agent(mock_config) -> WeatherAgent:
+    """Agent for tests that mutate it or assert on its exact memory contents."""
+    return WeatherAgent(mock_config)
+
+
+@pytest.fixture(scope="session")
+def shared_tool() -> WeatherAPITool:
+    """Weather tool shared by tests that do not depend on its cache."""
+    return WeatherAPITool()
+
+
+@pytest.fixture
+def fresh_tool() -> WeatherAPITool:
+    """Weather tool with an empty result cache."""
+    return WeatherAPITool()
+
+
+@pytest.fixture
+def memory() -> AgentMemory:
+    """Empty memory for memory tests.
+    
+    Constructed directly: AgentMemory() is about 3x faster than copy.copy of
+    a prototype, and a shallow copy would share the prototype's deques.
+    """
+    return AgentMemory()
+
+
+if pytest_benchmark is None:
+    @pytest.fixture
+    def benchmark():
+        """Skip benchmark tests when pytest-benchmark is not installed."""
+        pytest.skip("pytest-benchmark not installed")
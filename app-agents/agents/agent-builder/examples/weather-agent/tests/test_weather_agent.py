@@ -9,623 +9,799 @@ Author: Agent-Builder Framework
 Created: 2025-09-20
 """
 
-import unittest
+import asyncio
+import io
 import json
-import tempfile
 import os
+import re
 import sys
-from unittest.mock import Mock, patch, MagicMock
-from typing import Dict, Any, List
-import logging
+from unittest.mock import Mock, patch
+from typing import Dict, Any
+from collections import deque
+
+import pytest
 
 # Add the src directory to the path so we can import the agent
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from agent import WeatherAgent, AgentConfig, WeatherAPITool, AgentMemory
+import agent as agent_module
+from agent import WeatherAgent, AgentConfig, WeatherAPITool, AgentMemory, compile_validator, dump_json
+
+@pytest.fixture
+def mock_execute(monkeypatch) -> Mock:
+    """Replace WeatherAgent.execute_tool with a mock returning London weather."""
+    mock = Mock(return_value={
+        "success": True,
+        "data": {
+            "location": "London",
+            "temperature": 20.5,
+            "description": "sunny",
+            "humidity": 60,
+            "wind_speed": 10.0,
+            "units": "celsius"
+        }
+    })
+    monkeypatch.setattr(WeatherAgent, "execute_tool", mock)
+    return mock
+
+
+def assert_valid_response(response: Dict[str, Any]):
+    """Assert that a response has the expected structure."""
+    assert isinstance(response, dict)
+    assert "success" in response
+    assert isinstance(response["success"], bool)
+    
+    if response["success"]:
+        assert "data" in response
+    else:
+        assert "error" in response
+
+
+# Validators for the tool schema layout, compiled once for the whole module
+_TOOL_SCHEMA_VALIDATOR = compile_validator({
+    "required": ["name", "description", "parameters", "returns"],
+    "properties": {
+        "name": {"type": "string"},
+        "description": {"type": "string"},
+        "parameters": {"type": "object"},
+        "returns": {"type": "object"},
+    },
+})
+_PARAMETERS_VALIDATOR = compile_validator({
+    "required": ["type", "properties"],
+    "properties": {"type": {"enum": ["object"]}, "properties": {"type": "object"}},
+})
+_RETURNS_VALIDATOR = compile_validator({
+    "required": ["type"],
+    "properties": {"type": {"enum": ["object"]}},
+})
+
+
+def assert_tool_schema_valid(schema: Dict[str, Any]):
+    """Assert that a tool schema is valid."""
+    assert _TOOL_SCHEMA_VALIDATOR(schema), f"Invalid tool schema: {schema}"
+    assert _PARAMETERS_VALIDATOR(schema["parameters"]), "Parameters must be an object schema"
+    assert _RETURNS_VALIDATOR(schema["returns"]), "Returns must be an object schema"
+
+
+# WeatherAgent
+
+def test_agent_initialization(shared_agent):
+    """Test that the agent initializes correctly."""
+    assert shared_agent is not None
+    assert shared_agent.config.name == "test_weather_agent"
+    assert isinstance(shared_agent.tools, dict)
+    assert "weather_api" in shared_agent.tools
+    assert isinstance(shared_agent.memory, AgentMemory)
 
-# Suppress logging during tests unless debugging
-logging.getLogger().setLevel(logging.CRITICAL)
 
+def test_instances_use_slots(shared_agent):
+    """Test that shared_agent, memory and tool instances carry no per-instance dict."""
+    for obj in (shared_agent, shared_agent.memory, shared_agent.tools["weather_api"], shared_agent.config):
+        assert not hasattr(obj, "__dict__"), type(obj).__name__
 
-class TestAgentBase(unittest.TestCase):
-    """Base test class for agent testing with common utilities."""
+
+def test_agent_configuration(shared_agent):
+    """Test agent configuration handling."""
+    # Test default configuration
+    default_agent = WeatherAgent()
+    assert default_agent.config.name == "weather-agent"
+    assert default_agent.config.max_iterations == 10
+    
+    # Test custom configuration
+    assert shared_agent.config.name == "test_weather_agent"
+    assert shared_agent.config.max_iterations == 5
+
+
+@pytest.mark.parametrize("user_input", ["hello", "hi", "hey", "good morning"], ids=str)
+def test_process_user_input_greeting(shared_agent, user_input):
+    """Test greeting input processing."""
+    response = shared_agent.process_user_input(user_input)
+    assert isinstance(response, str)
+    assert "Weather Agent" in response
+
+
+@pytest.mark.parametrize("user_input", ["help", "what can you do", "commands"], ids=str)
+def test_process_user_input_help(shared_agent, user_input):
+    """Test help command processing."""
+    response = shared_agent.process_user_input(user_input).lower()
+    assert "weather" in response
+    assert "tool" in response
+
+
+def test_interactive_session_piped_input(fresh_agent):
+    """Test the interactive session reading a scripted conversation from a pipe."""
+    stdin = io.StringIO("hello\nweather in Paris\nquit\n")
+    stdout = io.StringIO()
+    
+    with patch("sys.stdin", stdin), patch("sys.stdout", stdout):
+        fresh_agent.run_interactive_session()
+    
+    output = stdout.getvalue()
+    assert fresh_agent.iteration_count == 2
+    assert output.count("You: ") == 3
+    assert "Weather in paris" in output
+    assert "Goodbye!" in output
+    assert not fresh_agent.is_running
+
+
+def test_interactive_session_ends_at_eof(fresh_agent):
+    """Test that the interactive session stops when piped input runs out."""
+    with patch("sys.stdin", io.StringIO("hello\n")), patch("sys.stdout", io.StringIO()):
+        fresh_agent.run_interactive_session()
     
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.test_data_dir = tempfile.mkdtemp()
-        self.mock_config = self._create_mock_config()
-        
-    def tearDown(self):
-        """Clean up after each test method."""
-        # Clean up temporary files
-        import shutil
-        if os.path.exists(self.test_data_dir):
-            shutil.rmtree(self.test_data_dir)
-    
-    def _create_mock_config(self) -> AgentConfig:
-        """Create a mock configuration for testing."""
-        return AgentConfig(
-            name="test_weather_agent",
-            description="Test weather agent for unit testing",
-            version="1.0.0",
-            max_iterations=5,
-            enable_human_feedback=False,
-            log_level="CRITICAL"
-        )
-    
-    def assert_valid_response(self, response: Dict[str, Any]):
-        """Assert that a response has the expected structure."""
-        self.assertIsInstance(response, dict)
-        self.assertIn("success", response)
-        self.assertIsInstance(response["success"], bool)
-        
-        if response["success"]:
-            self.assertIn("data", response)
-        else:
-            self.assertIn("error", response)
-    
-    def assert_tool_schema_valid(self, schema: Dict[str, Any]):
-        """Assert that a tool schema is valid."""
-        required_fields = ["name", "description", "parameters", "returns"]
-        for field in required_fields:
-            self.assertIn(field, schema, f"Schema missing required field: {field}")
-        
-        # Validate parameters structure
-        params = schema["parameters"]
-        self.assertIn("type", params)
-        self.assertEqual(params["type"], "object")
-        self.assertIn("properties", params)
-        
-        # Validate returns structure
-        returns = schema["returns"]
-        self.assertIn("type", returns)
-        self.assertEqual(returns["type"], "object")
-
-
-class TestWeatherAgent(TestAgentBase):
-    """Test cases for the WeatherAgent."""
-    
-    def setUp(self):
-        """Set up test fixtures for agent tests."""
-        super().setUp()
-        self.agent = WeatherAgent(self.mock_config)
-    
-    def test_agent_initialization(self):
-        """Test that the agent initializes correctly."""
-        self.assertIsNotNone(self.agent)
-        self.assertEqual(self.agent.config.name, "test_weather_agent")
-        self.assertIsInstance(self.agent.tools, dict)
-        self.assertIn("weather_api", self.agent.tools)
-        self.assertIsInstance(self.agent.memory, AgentMemory)
-    
-    def test_agent_configuration(self):
-        """Test agent configuration handling."""
-        # Test default configuration
-        default_agent = WeatherAgent()
-        self.assertEqual(default_agent.config.name, "weather-agent")
-        self.assertEqual(default_agent.config.max_iterations, 10)
-        
-        # Test custom configuration
-        self.assertEqual(self.agent.config.name, "test_weather_agent")
-        self.assertEqual(self.agent.config.max_iterations, 5)
-    
-    def test_process_user_input_greeting(self):
-        """Test greeting input processing."""
-        greetings = ["hello", "hi", "hey", "good morning"]
-        for greeting in greetings:
-            response = self.agent.process_user_input(greeting)
-            self.assertIsInstance(response, str)
-            self.assertIn("Weather Agent", response)
-            self.assertGreater(len(response), 0)
-    
-    def test_process_user_input_help(self):
-        """Test help command processing."""
-        help_commands = ["help", "what can you do", "commands"]
-        for help_cmd in help_commands:
-            response = self.agent.process_user_input(help_cmd)
-            self.assertIn("weather", response.lower())
-            self.assertIn("tool", response.lower())
-    
-    def test_weather_request_processing(self):
-        """Test weather request processing."""
-        with patch.object(self.agent, 'execute_tool') as mock_execute:
-            mock_execute.return_value = {
-                "success": True,
-                "data": {
-                    "location": "London",
-                    "temperature": 20.5,
-                    "description": "sunny",
-                    "humidity": 60,
-                    "wind_speed": 10.0,
-                    "units": "celsius"
-                }
-            }
-            
-            response = self.agent.process_user_input("What's the weather in London?")
-            self.assertIn("London", response)
-            self.assertIn("20.5", response)
-            self.assertIn("sunny", response.lower())
-            mock_execute.assert_called_once()
-    
-    def test_location_extraction(self):
-        """Test location extraction from user input."""
-        test_cases = [
-            ("What's the weather in London?", "London"),
-            ("Tell me the weather for New York", "New York"),
-            ("Weather in Tokyo please", "Tokyo"),
-            ("How's the weather at Paris", "Paris"),
-            ("What's the temperature in San Francisco", "San Francisco"),
-        ]
-        
-        for user_input, expected_location in test_cases:
-            location = self.agent._extract_location(user_input)
-            self.assertEqual(location.lower(), expected_location.lower())
-    
-    def test_location_extraction_no_location(self):
-        """Test location extraction when no location is provided."""
-        test_cases = [
-            "What's the weather?",
-            "Tell me the temperature",
-            "How's the weather today?",
-            "Weather please"
-        ]
-        
-        for user_input in test_cases:
-            location = self.agent._extract_location(user_input)
-            self.assertIsNone(location)
-    
-    def test_memory_functionality(self):
-        """Test agent memory system."""
-        # Test adding messages
-        self.agent.memory.add_message("user", "test message")
-        context = self.agent.memory.get_context()
-        self.assertIn("conversation_history", context)
-        self.assertEqual(len(context["conversation_history"]), 1)
-        self.assertEqual(context["conversation_history"][0]["content"], "test message")
-        
-        # Test adding tool results
-        self.agent.memory.add_tool_result("test_tool", {"result": "success"})
-        context = self.agent.memory.get_context()
-        self.assertIn("recent_tool_results", context)
-        self.assertEqual(len(context["recent_tool_results"]), 1)
-    
-    def test_tool_management(self):
-        """Test tool addition and management."""
-        # Test that weather_api tool is added by default
-        self.assertIn("weather_api", self.agent.tools)
-        
-        # Test adding a new tool
-        mock_tool = Mock()
-        mock_tool.name = "test_tool"
-        mock_tool.description = "Test tool"
-        
-        self.agent.add_tool(mock_tool)
-        self.assertIn("test_tool", self.agent.tools)
-        self.assertEqual(self.agent.tools["test_tool"], mock_tool)
-    
-    def test_error_handling(self):
-        """Test agent error handling."""
-        with patch.object(self.agent, '_generate_response', side_effect=Exception("Test error")):
-            response = self.agent.process_user_input("test")
-            self.assertIn("error", response.lower())
-            self.assertIn("apologize", response.lower())
-    
-    def test_status_reporting(self):
-        """Test agent status reporting."""
-        status = self.agent.get_status()
-        expected_fields = ["name", "version", "is_running", "iteration_count", "tools_count", "memory_size"]
-        for field in expected_fields:
-            self.assertIn(field, status)
-        
-        self.assertEqual(status["name"], self.agent.config.name)
-        self.assertEqual(status["version"], self.agent.config.version)
-        self.assertFalse(status["is_running"])
-        self.assertEqual(status["tools_count"], len(self.agent.tools))
-    
-    def test_conversation_export(self):
-        """Test conversation export functionality."""
-        # Add some conversation data
-        self.agent.process_user_input("Hello")
-        self.agent.process_user_input("What's the weather in London?")
-        
-        export_data = self.agent.export_conversation()
-        
-        required_fields = ["agent_config", "conversation_history", "tool_results", "status"]
-        for field in required_fields:
-            self.assertIn(field, export_data)
-        
-        # Check agent config
-        config = export_data["agent_config"]
-        self.assertEqual(config["name"], self.agent.config.name)
-        self.assertEqual(config["version"], self.agent.config.version)
-        
-        # Check conversation history
-        history = export_data["conversation_history"]
-        self.assertGreater(len(history), 0)
+    assert fresh_agent.iteration_count == 1
+
+
+def test_intent_priority(shared_agent):
+    """Test that help wins over weather, and weather over greetings."""
+    with patch.object(WeatherAgent, '_get_help_message', return_value="help text"):
+        assert shared_agent.process_user_input("hi, help me with the weather") == "help text"
+    
+    response = shared_agent.process_user_input("hello, what's the weather in Oslo?")
+    assert "Temperature" in response
+
+
+def test_weather_request_processing(shared_agent, mock_execute):
+    """Test weather request processing."""
+    response = shared_agent.process_user_input("What's the weather in London?")
+    assert "London" in response
+    assert "20.5" in response
+    assert "sunny" in response.lower()
+    mock_execute.assert_called_once()
+
+
+@pytest.mark.parametrize("user_input,expected_units", [
+    ("What's the weather in Tokyo?", "celsius"),
+    ("Weather for Frankfurt", "celsius"),
+    ("What's the temperature in Oslo in Fahrenheit", "fahrenheit"),
+    ("Weather in Rome in kelvin", "kelvin"),
+], ids=str)
+def test_units_detection(shared_agent, mock_execute, user_input, expected_units):
+    """Test that temperature units are only picked up from whole words."""
+    shared_agent.process_user_input(user_input)
+    assert mock_execute.call_args.kwargs["units"] == expected_units
+
+
+@pytest.mark.parametrize("user_input,expected_location", [
+    ("What's the weather in London?", "London"),
+    ("Tell me the weather for New York", "New York"),
+    ("Weather in Tokyo please", "Tokyo"),
+    ("How's the weather at Paris", "Paris"),
+    ("What's the temperature in San Francisco", "San Francisco"),
+], ids=str)
+def test_location_extraction(shared_agent, user_input, expected_location):
+    """Test location extraction from user input."""
+    location = shared_agent._extract_location(user_input)
+    assert location.lower() == expected_location.lower()
 
 
-class TestWeatherAPITool(TestAgentBase):
-    """Test cases for the WeatherAPITool."""
+@pytest.mark.parametrize("user_input", [
+    "What's the weather?",
+    "Tell me the temperature",
+    "How's the weather today?",
+    "Weather please",
+], ids=str)
+def test_location_extraction_no_location(shared_agent, user_input):
+    """Test location extraction when no location is provided."""
+    assert shared_agent._extract_location(user_input) is None
+
+
+def test_location_patterns_are_precompiled():
+    """Test that location extraction uses patterns compiled at import time."""
+    assert agent_module._LOCATION_PATTERNS
+    for pattern in (*agent_module._LOCATION_PATTERNS, agent_module._LOCATION_FILLER_RE, agent_module._PUNCTUATION_RE):
+        assert isinstance(pattern, re.Pattern)
+
+
+def test_memory_functionality(fresh_agent):
+    """Test agent memory system."""
+    # Test adding messages
+    fresh_agent.memory.add_message("user", "test message")
+    context = fresh_agent.memory.get_context()
+    assert "conversation_history" in context
+    assert len(context["conversation_history"]) == 1
+    assert context["conversation_history"][0]["content"] == "test message"
+    
+    # Test adding tool results
+    fresh_agent.memory.add_tool_result("test_tool", {"result": "success"})
+    context = fresh_agent.memory.get_context()
+    assert "recent_tool_results" in context
+    assert len(context["recent_tool_results"]) == 1
+
+
+def test_turn_shares_timestamp(fresh_agent):
+    """Test that messages and tool results from one turn share a timestamp."""
+    fresh_agent.process_user_input("What's the weather in London?")
+    
+    history = fresh_agent.memory.conversation_history
+    timestamps = {message["timestamp"] for message in history}
+    timestamps.add(fresh_agent.memory.tool_results[0]["timestamp"])
+    assert len(timestamps) == 1
+
+
+def test_input_lowered_once_per_turn(shared_agent):
+    """Test that the lowercased input is computed once and passed down."""
+    with patch.object(WeatherAgent, '_generate_response', autospec=True, return_value="ok") as generate:
+        shared_agent.process_user_input("Weather in PARIS")
     
-    def setUp(self):
-        """Set up test fixtures for tool tests."""
-        super().setUp()
-        self.tool = WeatherAPITool()
+    generate.assert_called_once_with(shared_agent, "Weather in PARIS", "weather in paris")
+
+
+def test_tool_management(fresh_agent):
+    """Test tool addition and management."""
+    # Test that weather_api tool is added by default
+    assert "weather_api" in fresh_agent.tools
+    
+    # Test adding a new tool
+    mock_tool = Mock()
+    mock_tool.name = "test_tool"
+    mock_tool.description = "Test tool"
+    
+    fresh_agent.add_tool(mock_tool)
+    assert "test_tool" in fresh_agent.tools
+    assert fresh_agent.tools["test_tool"] == mock_tool
+
+
+def test_error_handling(shared_agent, monkeypatch):
+    """Test agent error handling."""
+    monkeypatch.setattr(WeatherAgent, "_generate_response", Mock(side_effect=Exception("Test error")))
+    response = shared_agent.process_user_input("test")
+    assert "error" in response.lower()
+    assert "apologize" in response.lower()
+
+
+def test_status_reporting(shared_agent):
+    """Test agent status reporting."""
+    status = shared_agent.get_status()
+    expected_fields = {"name", "version", "is_running", "iteration_count", "tools_count", "memory_size"}
+    assert expected_fields <= status.keys()
+    
+    assert status["name"] == shared_agent.config.name
+    assert status["version"] == shared_agent.config.version
+    assert not status["is_running"]
+    assert status["tools_count"] == len(shared_agent.tools)
+
+
+def test_conversation_export(shared_agent):
+    """Test conversation export functionality."""
+    # Add some conversation data
+    shared_agent.process_user_input("Hello")
+    shared_agent.process_user_input("What's the weather in London?")
     
-    def test_tool_initialization(self):
-        """Test that the tool initializes correctly."""
-        self.assertIsNotNone(self.tool)
-        self.assertEqual(self.tool.name, "weather_api")
-        self.assertIn("weather", self.tool.description.lower())
+    export_data = shared_agent.export_conversation()
     
-    def test_tool_schema(self):
-        """Test tool schema generation."""
-        schema = self.tool.get_schema()
-        self.assert_tool_schema_valid(schema)
-        
-        # Check specific schema details
-        params = schema["parameters"]["properties"]
-        self.assertIn("location", params)
-        self.assertIn("units", params)
-        
-        # Check required parameters
-        required = schema["parameters"]["required"]
-        self.assertIn("location", required)
-    
-    def test_input_validation_success(self):
-        """Test successful input validation."""
-        valid_inputs = [
-            {"location": "London"},
-            {"location": "New York", "units": "celsius"},
-            {"location": "Tokyo", "units": "fahrenheit"},
-            {"location": "Paris", "units": "kelvin"},
-        ]
-        
-        for valid_input in valid_inputs:
-            self.assertTrue(self.tool.validate_input(**valid_input))
-    
-    def test_input_validation_failure(self):
-        """Test input validation failure scenarios."""
-        invalid_inputs = [
-            {},  # Missing location
-            {"location": ""},  # Empty location
-            {"location": "   "},  # Whitespace only location
-            {"location": 123},  # Non-string location
-            {"location": "London", "units": "invalid"},  # Invalid units
-        ]
-        
-        for invalid_input in invalid_inputs:
-            self.assertFalse(self.tool.validate_input(**invalid_input))
-    
-    def test_successful_execution(self):
-        """Test successful tool execution."""
-        result = self.tool.execute(location="London", units="celsius")
-        self.assert_valid_response(result)
-        self.assertTrue(result["success"])
-        
-        # Check data structure
-        data = result["data"]
-        expected_fields = ["location", "temperature", "description", "humidity", "wind_speed", "units"]
-        for field in expected_fields:
-            self.assertIn(field, data)
-        
-        # Check data types
-        self.assertIsInstance(data["temperature"], (int, float))
-        self.assertIsInstance(data["humidity"], int)
-        self.assertIsInstance(data["wind_speed"], (int, float))
-        self.assertEqual(data["units"], "celsius")
-    
-    def test_execution_with_different_units(self):
-        """Test tool execution with different temperature units."""
-        units_tests = ["celsius", "fahrenheit", "kelvin"]
-        
-        for units in units_tests:
-            result = self.tool.execute(location="London", units=units)
-            self.assertTrue(result["success"])
-            self.assertEqual(result["data"]["units"], units)
-    
-    def test_execution_with_invalid_input(self):
-        """Test tool execution with invalid input."""
-        result = self.tool.execute()  # No parameters
-        self.assert_valid_response(result)
-        self.assertFalse(result["success"])
-        self.assertIn("error", result)
-    
-    def test_weather_simulation(self):
-        """Test the weather simulation logic."""
-        # Test different locations to ensure variation
-        locations = ["London", "Arctic", "Sahara Desert", "Hawaii", "Alaska"]
-        
-        for location in locations:
-            weather_data = self.tool._simulate_weather_api(location, "celsius")
-            
-            # Check that all required fields are present
-            required_fields = ["location", "temperature", "description", "humidity", "wind_speed", "units"]
-            for field in required_fields:
-                self.assertIn(field, weather_data)
-            
-            # Check reasonable value ranges
-            self.assertIsInstance(weather_data["temperature"], (int, float))
-            self.assertGreaterEqual(weather_data["humidity"], 0)
-            self.assertLessEqual(weather_data["humidity"], 100)
-            self.assertGreaterEqual(weather_data["wind_speed"], 0)
-
-
-class TestAgentMemory(TestAgentBase):
-    """Test cases for the AgentMemory system."""
-    
-    def setUp(self):
-        """Set up test fixtures for memory tests."""
-        super().setUp()
-        self.memory = AgentMemory()
-    
-    def test_memory_initialization(self):
-        """Test memory system initialization."""
-        self.assertIsInstance(self.memory.conversation_history, list)
-        self.assertIsInstance(self.memory.context, dict)
-        self.assertIsInstance(self.memory.tool_results, list)
-        self.assertEqual(len(self.memory.conversation_history), 0)
-        self.assertEqual(len(self.memory.tool_results), 0)
-    
-    def test_add_message(self):
-        """Test adding messages to memory."""
-        self.memory.add_message("user", "Hello")
-        self.memory.add_message("assistant", "Hi there!")
-        
-        self.assertEqual(len(self.memory.conversation_history), 2)
-        
-        # Check message structure
-        message = self.memory.conversation_history[0]
-        self.assertEqual(message["role"], "user")
-        self.assertEqual(message["content"], "Hello")
-        self.assertIn("timestamp", message)
-        self.assertIn("metadata", message)
-    
-    def test_add_tool_result(self):
-        """Test adding tool results to memory."""
-        result = {"success": True, "data": {"temperature": 20}}
-        self.memory.add_tool_result("weather_api", result)
-        
-        self.assertEqual(len(self.memory.tool_results), 1)
-        
-        # Check tool result structure
-        tool_result = self.memory.tool_results[0]
-        self.assertEqual(tool_result["tool"], "weather_api")
-        self.assertEqual(tool_result["result"], result)
-        self.assertIn("timestamp", tool_result)
-    
-    def test_get_context(self):
-        """Test getting context from memory."""
-        # Add some data
-        for i in range(10):
-            self.memory.add_message("user", f"Message {i}")
-        
-        for i in range(5):
-            self.memory.add_tool_result(f"tool_{i}", {"result": i})
-        
-        context = self.memory.get_context()
-        
-        # Check context structure
-        self.assertIn("conversation_history", context)
-        self.assertIn("context", context)
-        self.assertIn("recent_tool_results", context)
-        
-        # Check that only recent items are included
-        self.assertEqual(len(context["conversation_history"]), 5)  # Last 5 messages
-        self.assertEqual(len(context["recent_tool_results"]), 3)   # Last 3 tool results
+    required_fields = {"agent_config", "conversation_history", "tool_results", "status"}
+    assert required_fields <= export_data.keys()
+    
+    # Check agent config
+    config = export_data["agent_config"]
+    assert config["name"] == shared_agent.config.name
+    assert config["version"] == shared_agent.config.version
+    
+    # Check conversation history
+    history = export_data["conversation_history"]
+    assert len(history) > 0
 
 
-class TestIntegration(TestAgentBase):
-    """Integration tests for agent and tool interactions."""
+def test_conversation_export_serialization(shared_agent):
+    """Test that the exported conversation round-trips through JSON."""
+    shared_agent.process_user_input("What's the weather in Zürich?")
     
-    def setUp(self):
-        """Set up test fixtures for integration tests."""
-        super().setUp()
-        self.agent = WeatherAgent(self.mock_config)
+    export_data = shared_agent.export_conversation()
+    encoded = dump_json(export_data)
     
-    def test_agent_tool_integration(self):
-        """Test agent using weather tool."""
-        result = self.agent.execute_tool("weather_api", location="London", units="celsius")
-        self.assert_valid_response(result)
-        self.assertTrue(result["success"])
-        
-        # Check that result was added to memory
-        context = self.agent.memory.get_context()
-        self.assertEqual(len(context["recent_tool_results"]), 1)
-        self.assertEqual(context["recent_tool_results"][0]["tool"], "weather_api")
-    
-    def test_end_to_end_weather_workflow(self):
-        """Test complete weather request workflow."""
-        user_input = "What's the weather in Tokyo?"
-        response = self.agent.process_user_input(user_input)
-        
-        # Check that response contains weather information
-        self.assertIn("Tokyo", response)
-        self.assertIn("Temperature", response)
-        
-        # Check that conversation was recorded
-        context = self.agent.memory.get_context()
-        self.assertEqual(len(context["conversation_history"]), 2)  # User + assistant
-        self.assertEqual(context["conversation_history"][0]["role"], "user")
-        self.assertEqual(context["conversation_history"][1]["role"], "assistant")
-    
-    def test_error_propagation(self):
-        """Test error handling across components."""
-        # Mock the weather tool to raise an exception
-        with patch.object(self.agent.tools["weather_api"], "execute", side_effect=Exception("API Error")):
-            result = self.agent.execute_tool("weather_api", location="London")
-            self.assertFalse(result["success"])
-            self.assertIn("error", result)
-    
-    def test_invalid_tool_execution(self):
-        """Test executing non-existent tool."""
-        result = self.agent.execute_tool("nonexistent_tool", param="value")
-        self.assertFalse(result["success"])
-        self.assertIn("not found", result["error"])
-
-
-class TestPerformance(TestAgentBase):
-    """Performance tests for the agent and tools."""
-    
-    def setUp(self):
-        """Set up test fixtures for performance tests."""
-        super().setUp()
-        self.agent = WeatherAgent(self.mock_config)
-    
-    def test_response_time(self):
-        """Test that responses are generated within acceptable time limits."""
-        import time
-        
-        start_time = time.time()
-        response = self.agent.process_user_input("What's the weather in London?")
-        end_time = time.time()
-        
-        # Should respond within 2 seconds for simulated API
-        self.assertLess(end_time - start_time, 2.0)
-        self.assertIsInstance(response, str)
-        self.assertGreater(len(response), 0)
-    
-    def test_memory_efficiency(self):
-        """Test memory usage with large conversation history."""
-        # Add many messages
-        for i in range(100):
-            self.agent.process_user_input(f"Message {i}")
-        
-        # Context should still be limited to recent items
-        context = self.agent.memory.get_context()
-        self.assertLessEqual(len(context["conversation_history"]), 5)
-        self.assertLessEqual(len(context["recent_tool_results"]), 3)
-    
-    def test_concurrent_tool_execution(self):
-        """Test multiple tool executions."""
-        import threading
-        import time
-        
-        results = []
-        
-        def execute_tool():
-            result = self.agent.execute_tool("weather_api", location="London")
-            results.append(result)
-        
-        # Execute multiple tools concurrently
-        threads = []
-        for _ in range(5):
-            thread = threading.Thread(target=execute_tool)
-            threads.append(thread)
-            thread.start()
-        
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
-        
-        # Check that all executions succeeded
-        self.assertEqual(len(results), 5)
-        for result in results:
-            self.assertTrue(result["success"])
-
-
-class TestSecurity(TestAgentBase):
-    """Security tests for the agent and tools."""
-    
-    def setUp(self):
-        """Set up test fixtures for security tests."""
-        super().setUp()
-        self.agent = WeatherAgent(self.mock_config)
-    
-    def test_input_sanitization(self):
-        """Test that malicious input is properly handled."""
-        malicious_inputs = [
-            "<script>alert('xss')</script>",
-            "'; DROP TABLE users; --",
-            "../../../etc/passwd",
-            "London'; DELETE FROM weather; --",
-            "<img src=x onerror=alert('xss')>",
-        ]
-        
-        for malicious_input in malicious_inputs:
-            # Should not crash and should return a reasonable response
-            response = self.agent.process_user_input(f"Weather in {malicious_input}")
-            self.assertIsInstance(response, str)
-            # Should not contain the malicious content directly
-            self.assertNotIn("<script>", response)
-            self.assertNotIn("DROP TABLE", response)
-    
-    def test_location_validation(self):
-        """Test location parameter validation."""
-        # Test extremely long location names
-        long_location = "A" * 1000
-        result = self.agent.execute_tool("weather_api", location=long_location)
-        # Should handle gracefully (either succeed or fail safely)
-        self.assertIn("success", result)
-    
-    def test_error_message_safety(self):
-        """Test that error messages don't expose sensitive information."""
-        # Force an error condition
-        with patch.object(self.agent.tools["weather_api"], "_simulate_weather_api", 
-                         side_effect=Exception("Internal system error: /etc/passwd")):
-            result = self.agent.execute_tool("weather_api", location="London")
-            
-            self.assertFalse(result["success"])
-            # Error message should not contain sensitive paths
-            self.assertNotIn("/etc/passwd", result["error"])
-
-
-def create_test_suite() -> unittest.TestSuite:
-    """Create a comprehensive test suite."""
-    suite = unittest.TestSuite()
-    
-    # Add test classes
-    test_classes = [
-        TestWeatherAgent,
-        TestWeatherAPITool,
-        TestAgentMemory,
-        TestIntegration,
-        TestPerformance,
-        TestSecurity
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == export_data
+
+
+def test_conversation_export_to_file(shared_agent, tmp_path):
+    """Test writing the exported conversation to disk the way main() does."""
+    shared_agent.process_user_input("What's the weather in London?")
+    export_data = shared_agent.export_conversation()
+    
+    export_file = tmp_path / "conversation.json"
+    export_file.write_bytes(dump_json(export_data))
+    
+    assert json.loads(export_file.read_text(encoding="utf-8")) == export_data
+
+
+# WeatherAPITool
+
+def test_tool_initialization(shared_tool):
+    """Test that the tool initializes correctly."""
+    assert shared_tool is not None
+    assert shared_tool.name == "weather_api"
+    assert "weather" in shared_tool.description.lower()
+
+
+def test_tool_schema(shared_tool):
+    """Test tool schema generation."""
+    schema = shared_tool.get_schema()
+    assert_tool_schema_valid(schema)
+    
+    # Check specific schema details
+    params = schema["parameters"]["properties"]
+    assert "location" in params
+    assert "units" in params
+    
+    # Check required parameters
+    required = schema["parameters"]["required"]
+    assert "location" in required
+
+
+def test_schema_is_shared(shared_tool):
+    """Test that the schema is built once rather than on every call."""
+    assert shared_tool.get_schema() is shared_tool.get_schema()
+    assert shared_tool.get_schema() is WeatherAPITool().get_schema()
+
+
+@pytest.mark.parametrize("kwargs", [
+    pytest.param({"location": "London"}, id="location-only"),
+    pytest.param({"location": "New York", "units": "celsius"}, id="celsius"),
+    pytest.param({"location": "Tokyo", "units": "fahrenheit"}, id="fahrenheit"),
+    pytest.param({"location": "Paris", "units": "kelvin"}, id="kelvin"),
+])
+def test_input_validation_success(shared_tool, kwargs):
+    """Test successful input validation."""
+    assert shared_tool.validate_input(**kwargs)
+
+
+@pytest.mark.parametrize("kwargs", [
+    pytest.param({}, id="missing-location"),
+    pytest.param({"location": ""}, id="empty-location"),
+    pytest.param({"location": "   "}, id="whitespace-location"),
+    pytest.param({"location": 123}, id="non-string-location"),
+    pytest.param({"location": "London", "units": "invalid"}, id="invalid-units"),
+    pytest.param({"location": "London", "units": ["celsius"]}, id="unhashable-units"),
+    pytest.param({"location": "London", "units": None}, id="none-units"),
+])
+def test_input_validation_failure(shared_tool, kwargs):
+    """Test input validation failure scenarios."""
+    assert not shared_tool.validate_input(**kwargs)
+
+
+def test_successful_execution(shared_tool):
+    """Test successful tool execution."""
+    result = shared_tool.execute(location="London", units="celsius")
+    assert_valid_response(result)
+    assert result["success"]
+    
+    # Check data structure
+    data = result["data"]
+    expected_fields = {"location", "temperature", "description", "humidity", "wind_speed", "units"}
+    assert expected_fields <= data.keys()
+    
+    # Check data types
+    assert isinstance(data["temperature"], (int, float))
+    assert isinstance(data["humidity"], int)
+    assert isinstance(data["wind_speed"], (int, float))
+    assert data["units"] == "celsius"
+
+
+@pytest.mark.parametrize("units", ["celsius", "fahrenheit", "kelvin"])
+def test_execution_with_different_units(shared_tool, units):
+    """Test tool execution with different temperature units."""
+    result = shared_tool.execute(location="London", units=units)
+    assert result["success"]
+    assert result["data"]["units"] == units
+
+
+def test_results_are_cached(fresh_tool):
+    """Test that repeated lookups reuse the cached weather data."""
+    with patch.object(WeatherAPITool, "_simulate_weather_api", wraps=fresh_tool._simulate_weather_api) as mock_api:
+        first = fresh_tool.execute(location="London", units="celsius")
+        second = fresh_tool.execute(location="london ", units="celsius")
+        fresh_tool.execute(location="London", units="kelvin")
+    
+    assert first["data"] == second["data"]
+    assert mock_api.call_count == 2
+
+
+def test_cached_results_expire(fresh_tool):
+    """Test that cached weather data is refreshed after the TTL."""
+    with patch.object(WeatherAPITool, "_simulate_weather_api", wraps=fresh_tool._simulate_weather_api) as mock_api:
+        with patch("agent.time.monotonic", return_value=1000.0):
+            fresh_tool.execute(location="London")
+        with patch("agent.time.monotonic", return_value=1000.0 + WeatherAPITool.CACHE_TTL + 1):
+            fresh_tool.execute(location="London")
+    
+    assert mock_api.call_count == 2
+
+
+def test_execution_with_invalid_input(shared_tool):
+    """Test tool execution with invalid input."""
+    result = shared_tool.execute()  # No parameters
+    assert_valid_response(result)
+    assert not result["success"]
+    assert "error" in result
+
+
+@pytest.mark.real_sim
+def test_weather_simulation(shared_tool):
+    """Test the weather simulation logic."""
+    # Test different locations to ensure variation
+    locations = ["London", "Arctic", "Sahara Desert", "Hawaii", "Alaska"]
+    
+    for location in locations:
+        weather_data = shared_tool._simulate_weather_api(location, "celsius")
+        
+        # Check that all required fields are present
+        required_fields = {"location", "temperature", "description", "humidity", "wind_speed", "units"}
+        assert required_fields <= weather_data.keys()
+        
+        # Check reasonable value ranges
+        assert isinstance(weather_data["temperature"], (int, float))
+        assert weather_data["humidity"] >= 0
+        assert weather_data["humidity"] <= 100
+        assert weather_data["wind_speed"] >= 0
+
+
+@pytest.mark.real_sim
+def test_simulate_batch(shared_tool):
+    """Test batch simulation with and without NumPy."""
+    locations = ["London", "Arctic", "Sahara Desert", "Hawaii"]
+    
+    for numpy_module in (agent_module.np, None):
+        with patch.object(agent_module, "np", numpy_module):
+            batch = shared_tool.simulate_batch(locations, "kelvin")
+        
+        assert [data["location"] for data in batch] == locations
+        for data in batch:
+            assert data["units"] == "kelvin"
+            assert data["description"] in agent_module._CONDITIONS
+            assert isinstance(data["humidity"], int)
+            assert 30 <= data["humidity"] <= 90
+        # Arctic base is -10°C, so it stays below 273.15 - 4 K
+        assert batch[1]["temperature"] < 269.2
+
+
+@pytest.mark.skipif(agent_module.np is None, reason="NumPy not installed")
+def test_simulate_batch_uses_compiled_kernel_above_threshold(shared_tool):
+    """Test that only large batches are routed to the Numba kernel."""
+    def fake_core(base_temps, units_code, seed):
+        return base_temps + 300
+    
+    kernel = Mock(side_effect=fake_core)
+    threshold = agent_module.NUMBA_THRESHOLD
+    
+    with patch.object(agent_module, "_sim_core", kernel):
+        small = shared_tool.simulate_batch(["Arctic"] * threshold, "kelvin")
+        kernel.assert_not_called()
+        
+        large = shared_tool.simulate_batch(["Arctic"] * (threshold + 1), "kelvin")
+    
+    kernel.assert_called_once()
+    assert kernel.call_args.args[1] == agent_module.UNITS_CODES["kelvin"]
+    assert len(small) == threshold
+    assert len(large) == threshold + 1
+    assert all(data["temperature"] == 290.0 for data in large)
+
+
+# AgentMemory
+
+def test_memory_initialization(memory):
+    """Test memory system initialization."""
+    assert isinstance(memory.conversation_history, deque)
+    assert isinstance(memory.context, dict)
+    assert isinstance(memory.tool_results, deque)
+    assert len(memory.conversation_history) == 0
+    assert len(memory.tool_results) == 0
+
+
+def test_add_message(memory):
+    """Test adding messages to memory."""
+    memory.add_message("user", "Hello")
+    memory.add_message("assistant", "Hi there!")
+    
+    assert len(memory.conversation_history) == 2
+    
+    # Check message structure
+    message = memory.conversation_history[0]
+    assert message["role"] == "user"
+    assert message["content"] == "Hello"
+    assert "timestamp" in message
+    assert "metadata" in message
+
+
+def test_add_tool_result(memory):
+    """Test adding tool results to memory."""
+    result = {"success": True, "data": {"temperature": 20}}
+    memory.add_tool_result("weather_api", result)
+    
+    assert len(memory.tool_results) == 1
+    
+    # Check tool result structure
+    tool_result = memory.tool_results[0]
+    assert tool_result["tool"] == "weather_api"
+    assert tool_result["result"] == result
+    assert "timestamp" in tool_result
+
+
+def test_memory_is_bounded(memory):
+    """Test that old entries are evicted once the limits are reached."""
+    for i in range(AgentMemory.MAX_MESSAGES + 10):
+        memory.add_message("user", f"Message {i}")
+    
+    for i in range(AgentMemory.MAX_TOOL_RESULTS + 10):
+        memory.add_tool_result(f"tool_{i}", {"result": i})
+    
+    assert len(memory.conversation_history) == AgentMemory.MAX_MESSAGES
+    assert memory.conversation_history[0]["content"] == "Message 10"
+    assert len(memory.tool_results) == AgentMemory.MAX_TOOL_RESULTS
+    assert memory.tool_results[0]["tool"] == "tool_10"
+
+
+def test_get_context(memory):
+    """Test getting context from memory."""
+    # Add some data
+    for i in range(10):
+        memory.add_message("user", f"Message {i}")
+    
+    for i in range(5):
+        memory.add_tool_result(f"tool_{i}", {"result": i})
+    
+    context = memory.get_context()
+    
+    # Check context structure
+    assert "conversation_history" in context
+    assert "context" in context
+    assert "recent_tool_results" in context
+    
+    # Check that only recent items are included
+    assert len(context["conversation_history"]) == 5  # Last 5 messages
+    assert len(context["recent_tool_results"]) == 3   # Last 3 tool results
+
+
+def test_get_context_with_query(memory):
+    """Test that a query pulls relevant older messages into the context."""
+    memory.add_message("user", "What's the weather in Reykjavik?")
+    for i in range(10):
+        memory.add_message("user", f"Message {i}")
+    
+    context = memory.get_context("Reykjavik weather again")
+    assert [message["content"] for message in context["conversation_history"]] == [
+        "What's the weather in Reykjavik?"
     ]
     
-    for test_class in test_classes:
-        tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
-        suite.addTests(tests)
+    # No match falls back to the most recent messages
+    context = memory.get_context("Lisbon")
+    assert context["conversation_history"][-1]["content"] == "Message 9"
+    assert len(context["conversation_history"]) == 5
+
+
+def test_context_index_follows_eviction(memory):
+    """Test that evicted messages are dropped from the context index."""
+    memory.add_message("user", "weather in Reykjavik")
+    for i in range(AgentMemory.MAX_MESSAGES):
+        memory.add_message("user", f"Message {i}")
+    
+    context = memory.get_context("Reykjavik")
+    assert "weather in Reykjavik" not in [m["content"] for m in context["conversation_history"]]
+    
+    context = memory.get_context("Message 10")
+    assert "Message 10" in [m["content"] for m in context["conversation_history"]]
+
+
+def test_context_query_follows_direct_history_edits(memory):
+    """Test that query results track changes made to the history directly."""
+    memory.add_message("user", "weather in Reykjavik")
+    assert memory.get_context("Reykjavik")["conversation_history"][0]["content"] == "weather in Reykjavik"
+    
+    memory.conversation_history.clear()
+    memory.conversation_history.append({"role": "user", "content": "Reykjavik again", "timestamp": "", "metadata": {}})
+    context = memory.get_context("Reykjavik")
+    assert [m["content"] for m in context["conversation_history"]] == ["Reykjavik again"]
+
+
+# Integration
+
+def test_agent_tool_integration(fresh_agent):
+    """Test agent using weather tool."""
+    result = fresh_agent.execute_tool("weather_api", location="London", units="celsius")
+    assert_valid_response(result)
+    assert result["success"]
+    
+    # Check that result was added to memory
+    context = fresh_agent.memory.get_context()
+    assert len(context["recent_tool_results"]) == 1
+    assert context["recent_tool_results"][0]["tool"] == "weather_api"
+
+
+def test_end_to_end_weather_workflow(fresh_agent):
+    """Test complete weather request workflow."""
+    user_input = "What's the weather in Tokyo?"
+    response = fresh_agent.process_user_input(user_input)
+    
+    # Check that response contains weather information
+    assert "Tokyo" in response
+    assert "Temperature" in response
+    
+    # Check that conversation was recorded
+    context = fresh_agent.memory.get_context()
+    assert len(context["conversation_history"]) == 2  # User + assistant
+    assert context["conversation_history"][0]["role"] == "user"
+    assert context["conversation_history"][1]["role"] == "assistant"
+
+
+def test_concurrent_tool_calls(fresh_agent):
+    """Test executing several tool calls concurrently."""
+    calls = [
+        ("weather_api", {"location": "London"}),
+        ("weather_api", {"location": "Tokyo", "units": "kelvin"}),
+        ("nonexistent_tool", {}),
+    ]
+    results = asyncio.run(fresh_agent.execute_tools(calls))
     
-    return suite
+    assert len(results) == 3
+    assert results[0]["data"]["location"] == "London"
+    assert results[1]["data"]["units"] == "kelvin"
+    assert not results[2]["success"]
+    assert len(fresh_agent.memory.tool_results) == 2
+
+
+def test_async_context_closes_tools(fresh_agent):
+    """Test that leaving the async context closes every tool."""
+    async def run_session():
+        async with fresh_agent as agent:
+            await agent.execute_tool_async("weather_api", location="London")
+    
+    with patch.object(WeatherAPITool, "aclose") as mock_aclose:
+        asyncio.run(run_session())
+        mock_aclose.assert_awaited_once()
+
+
+def test_tool_pool_reused_until_closed(fresh_agent):
+    """Test that async tool calls share one worker pool, shut down by aclose."""
+    tool = fresh_agent.tools["weather_api"]
+    
+    async def run_session():
+        await fresh_agent.execute_tool_async("weather_api", location="London")
+        executor = tool._executor
+        await fresh_agent.execute_tool_async("weather_api", location="Paris")
+        assert tool._executor is executor
+        await fresh_agent.aclose()
+        return executor
+    
+    executor = asyncio.run(run_session())
+    assert tool._executor is None
+    assert executor._shutdown
+
+
+def test_error_propagation(shared_agent, monkeypatch):
+    """Test error handling across components."""
+    # Mock the weather tool to raise an exception
+    monkeypatch.setattr(WeatherAPITool, "execute", Mock(side_effect=Exception("API Error")))
+    result = shared_agent.execute_tool("weather_api", location="London")
+    assert not result["success"]
+    assert "error" in result
+
+
+def test_invalid_tool_execution(shared_agent):
+    """Test executing non-existent tool."""
+    result = shared_agent.execute_tool("nonexistent_tool", param="value")
+    assert not result["success"]
+    assert "not found" in result["error"]
+
+
+# Performance
+
+@pytest.mark.benchmark
+def test_response_time(benchmark, shared_agent):
+    """Test that responses are generated within acceptable time limits."""
+    # Warm up first so one-time costs stay out of the measurement
+    shared_agent.process_user_input("What's the weather in London?")
+    
+    response = benchmark(shared_agent.process_user_input, "What's the weather in London?")
+    
+    # Stats are absent when benchmarks run with --benchmark-disable
+    if benchmark.stats is not None:
+        assert benchmark.stats.stats.mean < 0.5
+    assert isinstance(response, str)
+    assert len(response) > 0
+
+
+def test_memory_efficiency(fresh_agent):
+    """Test that the context stays bounded as the history grows."""
+    # A couple of entries past the context window is enough to exercise the bound
+    for i in range(7):
+        fresh_agent.memory.add_message("user", f"m{i}")
+    for i in range(4):
+        fresh_agent.memory.add_tool_result("weather_api", {"result": i})
+    
+    # Context should still be limited to recent items
+    context = fresh_agent.memory.get_context()
+    assert len(context["conversation_history"]) == 5
+    assert context["conversation_history"][-1]["content"] == "m6"
+    assert len(context["recent_tool_results"]) == 3
+
+
+def test_concurrent_tool_execution(shared_agent):
+    """Test multiple tool executions."""
+    async def execute_concurrently():
+        return await asyncio.gather(*(
+            asyncio.to_thread(shared_agent.execute_tool, "weather_api", location="London")
+            for _ in range(5)
+        ))
+    
+    results = asyncio.run(execute_concurrently())
+    
+    # Check that all executions succeeded
+    assert len(results) == 5
+    for result in results:
+        assert result["success"]
+
+
+# Security
+
+MALICIOUS_INPUTS = [
+    "<script>alert('xss')</script>",
+    "'; DROP TABLE users; --",
+    "../../../etc/passwd",
+    "London'; DELETE FROM weather; --",
+    "<img src=x onerror=alert('xss')>",
+]
+
+
+@pytest.mark.parametrize("payload", MALICIOUS_INPUTS, ids=str)
+def test_input_sanitization(shared_agent, payload):
+    """Test that malicious input is not passed through as a location."""
+    location = shared_agent._extract_location(f"Weather in {payload}")
+    if location is not None:
+        assert isinstance(location, str)
+        assert "<script>" not in location
+        assert "DROP TABLE" not in location
+
+
+def test_input_sanitization_end_to_end(shared_agent):
+    """Test one malicious input through the full pipeline."""
+    # Should not crash and should return a reasonable response
+    response = shared_agent.process_user_input(f"Weather in {MALICIOUS_INPUTS[0]}")
+    assert isinstance(response, str)
+    # Should not contain the malicious content directly
+    assert "<script>" not in response
+
+
+def test_location_validation(shared_agent):
+    """Test location parameter validation."""
+    # Test extremely long location names
+    long_location = "A" * 1000
+    result = shared_agent.execute_tool("weather_api", location=long_location)
+    # Should handle gracefully (either succeed or fail safely)
+    assert "success" in result
 
 
-def run_tests(verbosity: int = 2) -> unittest.TestResult:
-    """Run all tests and return the results."""
-    suite = create_test_suite()
-    runner = unittest.TextTestRunner(verbosity=verbosity)
-    return runner.run(suite)
+def test_error_message_safety(fresh_agent, monkeypatch):
+    """Test that error messages don't expose sensitive information."""
+    # Force an error condition; a fresh agent has no cached result to fall back on
+    monkeypatch.setattr(WeatherAPITool, "_simulate_weather_api",
+                        Mock(side_effect=Exception("Internal system error: /etc/passwd")))
+    result = fresh_agent.execute_tool("weather_api", location="London")
+    
+    assert not result["success"]
+    # Error message should not contain sensitive paths
+    assert "/etc/passwd" not in result["error"]
 
 
 if __name__ == "__main__":
-    # Run tests when script is executed directly
-    print("Running Weather Agent Test Suite")
-    print("=" * 50)
-    
-    result = run_tests()
-    
-    # Print summary
-    print("\n" + "=" * 50)
-    print("Test Summary:")
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    
-    if result.testsRun > 0:
-        success_rate = ((result.testsRun - len(result.failures) - len(result.errors)) / result.testsRun) * 100
-        print(f"Success rate: {success_rate:.1f}%")
-    
-    if result.failures:
-        print("\nFailures:")
-        for test, traceback in result.failures:
-            print(f"- {test}")
-    
-    if result.errors:
-        print("\nErrors:")
-        for test, traceback in result.errors:
-            print(f"- {test}")
-    
-    # Exit with appropriate code
-    exit_code = 0 if result.wasSuccessful() else 1
-    exit(exit_code)
+    sys.exit(pytest.main([__file__]))
@@ -9,12 +9,42 @@ Author: {{author_name}}
 Created: {{creation_date}}
 """
 
+import asyncio
 import logging
 import json
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+import os
+import re
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import cached_property, lru_cache, partial
+from typing import Callable, Deque, Dict, Any, List, NamedTuple, Optional, Tuple, Union
+from dataclasses import asdict, dataclass, field
 from abc import ABC, abstractmethod
 
+try:
+    import msgspec
+except ImportError:  # optional: fastest JSON export
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON export
+    orjson = None
+
+try:
+    import readline
+except ImportError:  # optional: line editing and history for input()
+    readline = None
+
+try:
+    import uvloop
+except ImportError:  # optional: faster event loop for the interactive session
+    uvloop = None
+
 
 # Configure logging for the agent
 logging.basicConfig(
@@ -24,15 +54,54 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Intent keywords made only of words and spaces are matched anywhere in the
+# input; any other keyword (such as "?") only matches the whole input
+_WORD_KEYWORD_RE = re.compile(r"[\w ]+")
+
+_QUIT_COMMANDS = frozenset({"quit", "exit", "bye"})
+
+
+@lru_cache(maxsize=1)
+def _ts(second: int) -> str:
+    """ISO timestamp for a whole second, reused by every record in that second."""
+    return datetime.fromtimestamp(second).isoformat()
+
+
+@dataclass(frozen=True, slots=True)
 class AgentConfig:
-    """Configuration class for the agent."""
+    """Configuration class for the agent.
+    
+    Immutable once created; ``log_level`` is resolved to ``log_level_int``
+    here so agents do not look it up on every construction.
+    """
     name: str = "{{agent_name}}"
     description: str = "{{agent_description}}"
     version: str = "1.0.0"
     max_iterations: int = 10
     enable_human_feedback: bool = {{enable_human_feedback}}
     log_level: str = "INFO"
+    # Oldest entries are dropped once a session exceeds these limits
+    history_maxlen: int = 200
+    tool_results_maxlen: int = 50
+    # Worker threads shared by batched tool calls; tools are mostly I/O-bound,
+    # so this follows ThreadPoolExecutor's own default rather than the CPU count
+    tool_pool_size: int = min(32, (os.cpu_count() or 1) + 4)
+    log_level_int: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Resolve the log level name to its numeric value."""
+        level = logging.getLevelName(self.log_level)
+        if not isinstance(level, int):
+            raise ValueError(f"Unknown log level: {self.log_level}")
+        # Frozen dataclass: bypass the generated __setattr__
+        object.__setattr__(self, "log_level_int", level)
+
+
+class ToolResult(NamedTuple):
+    """What a tool's ``execute`` may return, instead of the equivalent dict."""
+    success: bool
+    data: Dict[str, Any]
+    error: Optional[str] = None
 
 
 class Tool(ABC):
@@ -44,7 +113,7 @@ class Tool(ABC):
         self.logger = logging.getLogger(f"{__name__}.{name}")
     
     @abstractmethod
-    def execute(self, **kwargs) -> Dict[str, Any]:
+    def execute(self, **kwargs) -> Union[ToolResult, Dict[str, Any]]:
         """Execute the tool with given parameters."""
         pass
     
@@ -52,57 +121,90 @@ class Tool(ABC):
         """Validate input parameters for the tool."""
         return True
     
-    def get_schema(self) -> Dict[str, Any]:
-        """Return the input/output schema for this tool."""
+    @cached_property
+    def schema(self) -> Dict[str, Any]:
+        """The input/output schema for this tool, built once per instance.
+        
+        Shared between callers; use ``dict(tool.schema)`` for a copy to modify.
+        """
         return {
             "name": self.name,
             "description": self.description,
             "parameters": {},
             "returns": {}
         }
+    
+    def get_schema(self) -> Dict[str, Any]:
+        """Return the input/output schema for this tool."""
+        return self.schema
+
+
+@dataclass(slots=True)
+class Message:
+    """A single conversation message."""
+    role: str
+    content: str
+    timestamp: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class ToolCall:
+    """A tool execution recorded in memory."""
+    tool: str
+    result: Dict[str, Any]
+    timestamp: str
 
 
 class AgentMemory:
-    """Simple memory system for the agent."""
+    """Simple memory system for the agent.
+    
+    History and tool results are bounded deques, so memory stays constant
+    however long a session runs. Records are slotted dataclasses and only
+    become dicts when the conversation is exported.
+    """
     
-    def __init__(self):
-        self.conversation_history: List[Dict[str, Any]] = []
+    # How many of the latest entries get_context returns
+    RECENT_MESSAGES = 5
+    RECENT_TOOL_RESULTS = 3
+    
+    def __init__(self, history_maxlen: int = 200, tool_results_maxlen: int = 50):
+        self.conversation_history: Deque[Message] = deque(maxlen=history_maxlen)
         self.context: Dict[str, Any] = {}
-        self.tool_results: List[Dict[str, Any]] = []
+        self.tool_results: Deque[ToolCall] = deque(maxlen=tool_results_maxlen)
+        # Small windows over the latest entries, kept up to date on append
+        self._recent_messages: Deque[Message] = deque(maxlen=self.RECENT_MESSAGES)
+        self._recent_tool_results: Deque[ToolCall] = deque(maxlen=self.RECENT_TOOL_RESULTS)
     
     def add_message(self, role: str, content: str, metadata: Optional[Dict] = None):
         """Add a message to the conversation history."""
-        message = {
-            "role": role,
-            "content": content,
-            "timestamp": self._get_timestamp(),
-            "metadata": metadata or {}
-        }
+        message = Message(role, content, self._get_timestamp(), metadata or {})
         self.conversation_history.append(message)
-        logger.debug(f"Added message: {role} - {content[:100]}...")
+        self._recent_messages.append(message)
+        logger.debug("Added message: %s - %.100s...", role, content)
     
     def add_tool_result(self, tool_name: str, result: Dict[str, Any]):
         """Add a tool execution result to memory."""
-        tool_result = {
-            "tool": tool_name,
-            "result": result,
-            "timestamp": self._get_timestamp()
-        }
-        self.tool_results.append(tool_result)
-        logger.debug(f"Added tool result: {tool_name}")
+        tool_call = ToolCall(tool_name, result, self._get_timestamp())
+        self.tool_results.append(tool_call)
+        self._recent_tool_results.append(tool_call)
+        logger.debug("Added tool result: %s", tool_name)
     
     def get_context(self) -> Dict[str, Any]:
-        """Get the current context for the agent."""
+        """Get the current context for the agent.
+        
+        Recent entries are returned as tuples, a snapshot that later
+        messages do not change.
+        """
         return {
-            "conversation_history": self.conversation_history[-5:],  # Last 5 messages
+            "conversation_history": tuple(self._recent_messages),  # Last 5 messages
             "context": self.context,
-            "recent_tool_results": self.tool_results[-3:]  # Last 3 tool results
+            "recent_tool_results": tuple(self._recent_tool_results)  # Last 3 tool results
         }
     
     def _get_timestamp(self) -> str:
-        """Get current timestamp."""
-        from datetime import datetime
-        return datetime.now().isoformat()
+        """Get current timestamp, at one-second resolution."""
+        return _ts(int(time.time()))
 
 
 class {{agent_class_name}}:
@@ -119,19 +221,28 @@ class {{agent_class_name}}:
     
     def __init__(self, config: Optional[AgentConfig] = None):
         self.config = config or AgentConfig()
-        self.memory = AgentMemory()
+        self.memory = AgentMemory(self.config.history_maxlen, self.config.tool_results_maxlen)
         self.tools: Dict[str, Tool] = {}
+        # Tool name -> (tool, whether to call validate_input), filled in by
+        # add_tool; tools that keep the always-True default skip the call
+        self._dispatch: Dict[str, Tuple[Tool, bool]] = {}
+        # Built on first request, cleared whenever the tool set changes
+        self._help_cache: Optional[str] = None
+        self._intent_handlers: Optional[Dict[str, Callable[[str], str]]] = None
+        self._intent_re: Optional[re.Pattern] = None
         self.iteration_count = 0
         self.is_running = False
+        # Created on first batched tool call and reused until close()
+        self._pool: Optional[ThreadPoolExecutor] = None
         
         # Set up logging
         self.logger = logging.getLogger(f"{__name__}.{self.config.name}")
-        self.logger.setLevel(getattr(logging, self.config.log_level))
+        self.logger.setLevel(self.config.log_level_int)
         
         # Initialize tools
         self._initialize_tools()
         
-        self.logger.info(f"Initialized {self.config.name} v{self.config.version}")
+        self.logger.info("Initialized %s v%s", self.config.name, self.config.version)
     
     def _initialize_tools(self):
         """Initialize all tools for this agent."""
@@ -140,49 +251,100 @@ class {{agent_class_name}}:
         # self.add_tool(ExampleTool())
         pass
     
+    def _log_error(self, msg: str, *args: Any, exc_info: bool = False):
+        """Log an error, skipping record and traceback handling when ERROR is disabled."""
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(msg, *args, exc_info=exc_info)
+    
     def add_tool(self, tool: Tool):
         """Add a tool to the agent's toolkit."""
-        self.tools[tool.name] = tool
-        self.logger.info(f"Added tool: {tool.name}")
+        key = sys.intern(tool.name)
+        self.tools[key] = tool
+        # Decided once here, so patch validate_input on a tool that keeps the
+        # default before adding it; execute is looked up on every call
+        validate_input = getattr(tool, "validate_input", None)
+        needs_validate = (
+            validate_input is not None
+            and getattr(validate_input, "__func__", None) is not Tool.validate_input
+        )
+        self._dispatch[key] = (tool, needs_validate)
+        self._help_cache = None
+        self._intent_handlers = None
+        self.logger.info("Added tool: %s", key)
     
     def execute_tool(self, tool_name: str, **kwargs) -> Dict[str, Any]:
         """Execute a specific tool with error handling."""
-        if tool_name not in self.tools:
+        entry = self._dispatch.get(tool_name)
+        if entry is None:
             error_msg = f"Tool '{tool_name}' not found. Available tools: {list(self.tools.keys())}"
-            self.logger.error(error_msg)
-            return {"error": error_msg, "success": False}
+            self._log_error(error_msg)
+            return ToolResult(False, {}, error_msg)._asdict()
         
-        tool = self.tools[tool_name]
+        tool, needs_validate = entry
         
         try:
             # Validate input
-            if not tool.validate_input(**kwargs):
+            if needs_validate and not tool.validate_input(**kwargs):
                 error_msg = f"Invalid input for tool '{tool_name}'"
-                self.logger.error(error_msg)
-                return {"error": error_msg, "success": False}
+                self._log_error(error_msg)
+                return ToolResult(False, {}, error_msg)._asdict()
             
             # Execute tool
-            self.logger.info(f"Executing tool: {tool_name}")
+            self.logger.info("Executing tool: %s", tool_name)
             result = tool.execute(**kwargs)
+            if isinstance(result, ToolResult):
+                result = result._asdict()
+            else:
+                # Ensure result has success flag
+                result.setdefault("success", True)
             
             # Add result to memory
             self.memory.add_tool_result(tool_name, result)
             
-            # Ensure result has success flag
-            if "success" not in result:
-                result["success"] = True
-            
-            self.logger.info(f"Tool '{tool_name}' executed successfully")
+            self.logger.info("Tool '%s' executed successfully", tool_name)
             return result
             
         except Exception as e:
             error_msg = f"Error executing tool '{tool_name}': {str(e)}"
-            self.logger.error(error_msg, exc_info=True)
-            return {"error": error_msg, "success": False}
+            self._log_error(error_msg, exc_info=True)
+            return ToolResult(False, {}, error_msg)._asdict()
+    
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Return the tool worker pool, creating it if needed."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.config.tool_pool_size,
+                thread_name_prefix=self.config.name
+            )
+        return self._pool
+    
+    def execute_tools(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Execute independent tool calls in parallel, returning results in order."""
+        if len(calls) <= 1:
+            return [self.execute_tool(name, **args) for name, args in calls]
+        pool = self._get_pool()
+        futures = [pool.submit(self.execute_tool, name, **args) for name, args in calls]
+        return [future.result() for future in futures]
+    
+    async def execute_tool_async(self, tool_name: str, **kwargs) -> Dict[str, Any]:
+        """Execute a tool in a worker thread so the event loop stays free."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_pool(), partial(self.execute_tool, tool_name, **kwargs))
+    
+    async def execute_tools_async(self, planned: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Execute independent tool calls concurrently, returning results in order."""
+        return await asyncio.gather(*(self.execute_tool_async(name, **args) for name, args in planned))
+    
+    def _plan_tool_calls(self, user_input: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """Decide which tools to call for a user input, as (tool_name, kwargs) pairs."""
+        # TODO: Return the independent tool calls this input needs
+        # Example:
+        # return [("example_tool", {"query": user_input})]
+        return []
     
     def process_user_input(self, user_input: str) -> str:
         """Process user input and return a response."""
-        self.logger.info(f"Processing user input: {user_input[:100]}...")
+        self.logger.info("Processing user input: %.100s...", user_input)
         
         # Add user message to memory
         self.memory.add_message("user", user_input)
@@ -204,7 +366,33 @@ class {{agent_class_name}}:
             
         except Exception as e:
             error_msg = f"Error processing user input: {str(e)}"
-            self.logger.error(error_msg, exc_info=True)
+            self._log_error(error_msg, exc_info=True)
+            return f"I apologize, but I encountered an error: {error_msg}"
+    
+    async def process_user_input_async(self, user_input: str) -> str:
+        """Process user input, running the planned tool calls concurrently."""
+        self.logger.info("Processing user input: %.100s...", user_input)
+        
+        # Add user message to memory
+        self.memory.add_message("user", user_input)
+        
+        try:
+            # Independent tool calls overlap, so a turn waits for the slowest
+            # tool rather than the sum of all of them
+            planned = self._plan_tool_calls(user_input)
+            if planned:
+                await self.execute_tools_async(planned)
+            
+            response = self._generate_response(user_input)
+            
+            # Add agent response to memory
+            self.memory.add_message("assistant", response)
+            
+            return response
+            
+        except Exception as e:
+            error_msg = f"Error processing user input: {str(e)}"
+            self._log_error(error_msg, exc_info=True)
             return f"I apologize, but I encountered an error: {error_msg}"
     
     def _generate_response(self, user_input: str) -> str:
@@ -215,65 +403,161 @@ class {{agent_class_name}}:
         context = self.memory.get_context()
         
         # Example response logic
-        if "help" in user_input.lower():
-            return self._get_help_message()
+        response = self._route_intent(user_input)
+        if response is not None:
+            return response
         
         return f"I received your message: '{user_input}'. This is a template response."
     
-    def _get_help_message(self) -> str:
-        """Generate a help message listing available tools and capabilities."""
-        help_msg = f"I am {self.config.name} - {self.config.description}\n\n"
-        help_msg += "Available tools:\n"
+    def _get_intent_handlers(self) -> Dict[str, Callable[[str], str]]:
+        """Map intent keywords to handlers that take the user input and return a response."""
+        # TODO: Add keywords for your agent's intents, e.g. one per tool
+        # Example:
+        # "search": self._handle_search,
+        return {
+            "help": self._handle_help,
+            "commands": self._handle_help,
+            "?": self._handle_help
+        }
+    
+    def _handle_help(self, user_input: str) -> str:
+        """Intent handler for help requests."""
+        return self._get_help_message()
+    
+    def _build_intent_router(self):
+        """Compile the intent keywords into one regex alternation, longest first."""
+        self._intent_handlers = {
+            keyword.lower(): handler for keyword, handler in self._get_intent_handlers().items()
+        }
+        words = sorted(
+            (keyword for keyword in self._intent_handlers if _WORD_KEYWORD_RE.fullmatch(keyword)),
+            key=len, reverse=True
+        )
+        self._intent_re = (
+            re.compile(r"(?i)\b(" + "|".join(map(re.escape, words)) + r")\b") if words else None
+        )
+    
+    def _route_intent(self, user_input: str) -> Optional[str]:
+        """Return the response of the handler whose keyword the input matches, if any."""
+        if self._intent_handlers is None:
+            self._build_intent_router()
         
-        for tool_name, tool in self.tools.items():
-            help_msg += f"- {tool_name}: {tool.description}\n"
+        handler = self._intent_handlers.get(user_input.strip().lower())
+        if handler is None and self._intent_re is not None:
+            match = self._intent_re.search(user_input)
+            if match:
+                handler = self._intent_handlers[match.group(1).lower()]
         
-        if not self.tools:
-            help_msg += "No tools are currently available.\n"
+        return handler(user_input) if handler is not None else None
+    
+    def _get_help_message(self) -> str:
+        """Generate a help message listing available tools and capabilities."""
+        if self._help_cache is None:
+            lines = [f"I am {self.config.name} - {self.config.description}", "", "Available tools:"]
+            lines.extend(f"- {tool_name}: {tool.description}" for tool_name, tool in self.tools.items())
+            
+            if not self.tools:
+                lines.append("No tools are currently available.")
+            
+            self._help_cache = "\n".join(lines) + "\n"
         
-        return help_msg
+        return self._help_cache
     
     def run_interactive_session(self):
         """Run an interactive session with the user."""
+        # Choose the loop only for this runner, leaving the process-wide
+        # event loop policy alone
+        loop_factory = uvloop.new_event_loop if uvloop is not None else None
+        try:
+            with asyncio.Runner(loop_factory=loop_factory) as runner:
+                runner.run(self.run_interactive_session_async())
+        finally:
+            self.close()
+    
+    async def run_interactive_session_async(self):
+        """Run an interactive session on the event loop, reading stdin in a thread."""
         self.logger.info("Starting interactive session")
         self.is_running = True
+        write = sys.stdout.write
         
-        print(f"Welcome to {self.config.name}!")
-        print(f"{self.config.description}")
-        print("Type 'quit' or 'exit' to end the session.\n")
+        write(
+            f"Welcome to {self.config.name}!\n"
+            f"{self.config.description}\n"
+            "Type 'quit' or 'exit' to end the session.\n\n"
+        )
         
         try:
             while self.is_running and self.iteration_count < self.config.max_iterations:
-                user_input = input("> ").strip()
+                user_input = (await self._read_line("> ")).strip()
                 
-                if user_input.lower() in ['quit', 'exit', 'bye']:
-                    print("Goodbye!")
+                if user_input.lower() in _QUIT_COMMANDS:
+                    write("Goodbye!\n")
                     break
                 
                 if not user_input:
                     continue
                 
-                response = self.process_user_input(user_input)
-                print(f"\n{response}\n")
+                response = await self.process_user_input_async(user_input)
+                write(f"\n{response}\n\n")
                 
                 self.iteration_count += 1
                 
                 # Human-in-the-loop checkpoint
                 if self.config.enable_human_feedback and self.iteration_count % 5 == 0:
-                    feedback = input("How am I doing? (Press Enter to continue): ").strip()
+                    feedback = (await self._read_line("How am I doing? (Press Enter to continue): ")).strip()
                     if feedback:
                         self.memory.add_message("feedback", feedback)
-                        print("Thank you for the feedback!\n")
+                        write("Thank you for the feedback!\n\n")
         
-        except KeyboardInterrupt:
-            print("\nSession interrupted by user.")
+        # Under asyncio.run, Ctrl-C cancels this coroutine rather than raising
+        # KeyboardInterrupt
+        except (KeyboardInterrupt, EOFError, asyncio.CancelledError):
+            write("\nSession interrupted by user.\n")
         except Exception as e:
-            self.logger.error(f"Error in interactive session: {str(e)}", exc_info=True)
-            print(f"An error occurred: {str(e)}")
+            self._log_error("Error in interactive session: %s", e, exc_info=True)
+            write(f"An error occurred: {str(e)}\n")
         finally:
+            sys.stdout.flush()
             self.is_running = False
             self.logger.info("Interactive session ended")
     
+    @staticmethod
+    async def _read_line(prompt: str) -> str:
+        """Read one line from stdin in a daemon thread.
+        
+        Unlike the default executor, the thread is not joined when the loop
+        shuts down, so Ctrl-C while waiting for input does not hang on input().
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        
+        def resolve(line: Optional[str], error: Optional[BaseException]):
+            if future.done():
+                return
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(line)
+        
+        def read():
+            try:
+                outcome = (input(prompt), None)
+            except Exception as e:  # EOFError at end of input
+                outcome = (None, e)
+            try:
+                loop.call_soon_threadsafe(resolve, *outcome)
+            except RuntimeError:  # loop already closed after Ctrl-C
+                pass
+        
+        threading.Thread(target=read, daemon=True).start()
+        return await future
+    
+    def close(self):
+        """Shut down the tool worker pool; it is recreated if tools run again."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+    
     def get_status(self) -> Dict[str, Any]:
         """Get the current status of the agent."""
         return {
@@ -293,14 +577,29 @@ class {{agent_class_name}}:
                 "version": self.config.version,
                 "description": self.config.description
             },
-            "conversation_history": self.memory.conversation_history,
-            "tool_results": self.memory.tool_results,
+            "conversation_history": [asdict(message) for message in self.memory.conversation_history],
+            "tool_results": [asdict(tool_result) for tool_result in self.memory.tool_results],
             "status": self.get_status()
         }
 
 
+def dump_json(data: Dict[str, Any]) -> bytes:
+    """Serialize data as indented UTF-8 JSON, using msgspec or orjson when installed."""
+    if msgspec is not None:
+        return msgspec.json.format(msgspec.json.encode(data), indent=2)
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 def main():
     """Main function to run the agent."""
+    # Records never use thread or process names, so skip looking them up.
+    # Set here rather than at import, as the flags are process-wide.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
     # Create agent configuration
     config = AgentConfig()
     
@@ -312,8 +611,8 @@ def main():
     
     # Export conversation for review
     conversation_data = agent.export_conversation()
-    with open(f"{config.name}_conversation.json", "w") as f:
-        json.dump(conversation_data, f, indent=2)
+    with open(f"{config.name}_conversation.json", "wb") as f:
+        f.write(dump_json(conversation_data))
     
     print(f"Conversation exported to {config.name}_conversation.json")
 
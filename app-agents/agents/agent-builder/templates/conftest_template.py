@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Shared fixtures for the {{agent_name}} test suite
+
+Read-only agent and tool instances are built once per module; tests that
+mutate state ask for a fresh instance instead. Tests that write files use
+``test_data_dir``, a subdirectory of one scratch directory per module.
+
+Author: {{author_name}}
+Created: {{creation_date}}
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+from typing import Dict, Any
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _quiet(caplog):
+    """Silence logging below CRITICAL for the duration of each test."""
+    caplog.set_level(logging.CRITICAL)
+
+
+@pytest.fixture(scope="module")
+def _data_root():
+    """One scratch directory per test module, on tmpfs when available."""
+    root = tempfile.mkdtemp(dir="/dev/shm" if os.path.isdir("/dev/shm") else None)
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture
+def test_data_dir(_data_root) -> str:
+    """Empty directory for a single test's files."""
+    return tempfile.mkdtemp(dir=_data_root)
+
+
+@pytest.fixture(scope="session")
+def mock_config() -> Dict[str, Any]:
+    """Create a mock configuration for testing."""
+    return {
+        "name": "test_agent",
+        "description": "Test agent for unit testing",
+        "version": "1.0.0",
+        "max_iterations": 5,
+        "enable_human_feedback": False,
+        "log_level": "CRITICAL"
+    }
+
+
+def _create_test_agent(mock_config: Dict[str, Any]):
+    """Create a test agent instance."""
+    # TODO: Import and instantiate your agent class here
+    # Example:
+    # from your_agent_module import YourAgent, AgentConfig
+    # config = AgentConfig(**mock_config)
+    # return YourAgent(config)
+    return None
+
+
+def _create_test_tool():
+    """Create a test tool instance."""
+    # TODO: Import and instantiate your tool class here
+    # Example:
+    # from your_tool_module import YourTool, ToolConfig
+    # config = ToolConfig(name="test_tool", description="Test tool")
+    # return YourTool(config)
+    return None
+
+
+@pytest.fixture(scope="module")
+def agent(mock_config):
+    """Agent shared by the tests of a module that do not change its state."""
+    return _create_test_agent(mock_config)
+
+
+@pytest.fixture
+def fresh_agent(mock_config):
+    """Agent for tests that mutate it or assert on its exact memory contents."""
+    return _create_test_agent(mock_config)
+
+
+@pytest.fixture(scope="module")
+def tool():
+    """Tool shared by the tests of a module that do not change its state."""
+    return _create_test_tool()
+
+
+@pytest.fixture
+def fresh_tool():
+    """Tool for tests that depend on its statistics or cache."""
+    return _create_test_tool()
+
+
+@pytest.fixture
+def integrated_agent(fresh_agent, fresh_tool):
+    """Fresh agent with a fresh tool added, for integration tests."""
+    # Add tool to agent if both are available
+    if fresh_agent and fresh_tool:
+        fresh_agent.add_tool(fresh_tool)
+    return fresh_agent
@@ -9,23 +9,50 @@ Author: {{author_name}}
 Created: {{creation_date}}
 """
 
+import copy
+import hashlib
+import json
 import logging
-from typing import Dict, Any, Optional, List
+import threading
+import time
+from collections import OrderedDict
+from weakref import WeakValueDictionary
+from typing import Callable, ClassVar, Dict, Any, FrozenSet, Optional, List, Tuple
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
+try:
+    import fastjsonschema
+except ImportError:  # optional: generated, full JSON schema validation
+    fastjsonschema = None
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON serialization
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolConfig:
-    """Configuration for the tool."""
+    """Configuration for the tool; use dataclasses.replace to derive a changed copy."""
     name: str = "{{tool_name}}"
     description: str = "{{tool_description}}"
     version: str = "1.0.0"
     timeout_seconds: int = 30
     retry_attempts: int = 3
+    # Only these exceptions are retried; anything else fails immediately
+    retriable_exceptions: Tuple[type, ...] = (Exception,)
+    # Results kept for repeated identical calls; 0 disables the cache. Only
+    # used when _execute_main_logic is marked @cacheable (no side effects).
+    cache_size: int = 0
+    # Result metadata carries a copy of the parameters, with long strings cut
+    # to params_repr_limit characters, or only a digest of their names, types
+    # and sizes when disabled
+    include_params_in_metadata: bool = True
+    params_repr_limit: int = 1024
 
 
 class ToolError(Exception):
@@ -43,6 +70,139 @@ class ToolExecutionError(ToolError):
     pass
 
 
+# Errors execute reports without a traceback
+_HANDLED = (ToolValidationError, ToolExecutionError)
+
+
+# JSON schema type -> (accepted Python types, name used in error messages)
+_TYPE_CHECKS = {
+    "string": (str, "a string"),
+    "integer": (int, "an integer"),
+    "number": ((int, float), "a number"),
+    "boolean": (bool, "a boolean")
+}
+
+
+def _dumps(data: Any) -> str:
+    """Serialize data as indented JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
+
+
+def cacheable(func: Callable) -> Callable:
+    """Mark ``_execute_main_logic`` as free of side effects, so results may be cached."""
+    func.cacheable = True
+    return func
+
+
+def _hashable(value: Any) -> Any:
+    """Convert a JSON-like value into a hashable equivalent.
+    
+    Values are tagged with their type: ``1``, ``1.0`` and ``True`` compare
+    equal but must not share a cache entry, nor must a list and a tuple.
+    """
+    if isinstance(value, dict):
+        return frozenset((key, _hashable(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_hashable(item) for item in value))
+    return (type(value), value)
+
+
+def _params_digest(params: Dict[str, Any]) -> str:
+    """Return a stable digest of the parameters' names, types and sizes.
+    
+    Scalars contribute their value; strings and containers only their length,
+    so large payloads are never read or copied.
+    """
+    shape = []
+    for name in sorted(params):
+        value = params[name]
+        if value is None or isinstance(value, (bool, int, float)):
+            detail = value
+        elif isinstance(value, (str, bytes, list, tuple, dict)):
+            detail = len(value)
+        else:
+            detail = None
+        shape.append((name, type(value).__name__, detail))
+    return hashlib.blake2b(repr(shape).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _truncate_params(params: Dict[str, Any], limit: int) -> Dict[str, Any]:
+    """Return a copy of params with string values cut to ``limit`` characters."""
+    return {
+        name: value[:limit] + "..." if isinstance(value, str) and len(value) > limit else value
+        for name, value in params.items()
+    }
+
+
+@dataclass(slots=True)
+class PropSpec:
+    """Compiled constraints for one input parameter."""
+    name: str
+    type: str
+    minimum: Optional[float]
+    maximum: Optional[float]
+    check: Callable[[Any], None]
+
+
+@dataclass(slots=True, weakref_slot=True)
+class CompiledSchema:
+    """A tool schema compiled once for validation, plus the schema itself."""
+    name: str
+    version: str
+    required: Tuple[str, ...]
+    required_set: FrozenSet[str]
+    # Only parameters with a checkable type
+    properties: Tuple[PropSpec, ...]
+    # Full JSON schema validator generated for the parameters, when available
+    validate_fn: Optional[Callable[[Dict[str, Any]], Any]]
+    # The plain schema dict get_schema returns
+    schema: Dict[str, Any]
+
+
+def _compile_property(param_name: str, param_schema: Dict[str, Any]) -> Optional[PropSpec]:
+    """Compile a parameter's type and range constraints into one check function."""
+    expected_type = param_schema.get("type")
+    if expected_type not in _TYPE_CHECKS:
+        return None
+    accepted, type_name = _TYPE_CHECKS[expected_type]
+    
+    # Range validation applies to numbers only
+    is_numeric = expected_type in ("integer", "number")
+    minimum = param_schema.get("minimum") if is_numeric else None
+    maximum = param_schema.get("maximum") if is_numeric else None
+    
+    def check(value: Any):
+        if not isinstance(value, accepted):
+            raise ToolValidationError(f"Parameter '{param_name}' must be {type_name}")
+        if minimum is not None and value < minimum:
+            raise ToolValidationError(f"Parameter '{param_name}' must be >= {minimum}")
+        if maximum is not None and value > maximum:
+            raise ToolValidationError(f"Parameter '{param_name}' must be <= {maximum}")
+    
+    return PropSpec(param_name, expected_type, minimum, maximum, check)
+
+
+def _compile(schema: Dict[str, Any]) -> CompiledSchema:
+    """Compile a tool schema into the structure validate_input reads."""
+    parameters = schema["parameters"]
+    required = tuple(parameters.get("required", []))
+    properties = (
+        _compile_property(param_name, param_schema)
+        for param_name, param_schema in parameters.get("properties", {}).items()
+    )
+    return CompiledSchema(
+        name=schema["name"],
+        version=schema["version"],
+        required=required,
+        required_set=frozenset(required),
+        properties=tuple(spec for spec in properties if spec is not None),
+        validate_fn=fastjsonschema.compile(parameters) if fastjsonschema is not None else None,
+        schema=schema
+    )
+
+
 class {{tool_class_name}}:
     """
     {{tool_description}}
@@ -55,21 +215,90 @@ class {{tool_class_name}}:
     - Retry logic for transient failures
     """
     
+    __slots__ = (
+        "config", "logger", "execution_count", "success_count", "error_count", "_stats_lock",
+        "_name", "_version", "_retries", "_retriable", "_cache", "_cache_lock", "_cache_size",
+        "_include_params", "_params_limit",
+        "_compiled"
+    )
+    
+    # (tool class, config) -> compiled schema shared by the live instances built from them
+    _SCHEMA_CACHE: ClassVar["WeakValueDictionary[Tuple[type, ToolConfig], CompiledSchema]"] = WeakValueDictionary()
+    
     def __init__(self, config: Optional[ToolConfig] = None):
         self.config = config or ToolConfig()
         self.logger = logging.getLogger(f"{__name__}.{self.config.name}")
         self.execution_count = 0
         self.success_count = 0
         self.error_count = 0
+        # Guards the counters so concurrent execute() calls are all counted
+        self._stats_lock = threading.Lock()
+        # Guards the result cache separately, so cache lookups do not wait on the counters
+        self._cache_lock = threading.Lock()
         
-        self.logger.info(f"Initialized {self.config.name} v{self.config.version}")
+        # Config values read on every execution, and the schema and the parts
+        # validate_input reads, are bound once here
+        self._bind_config()
+        self._compile_schema()
+        
+        self.logger.info("Initialized %s v%s", self._name, self._version)
+    
+    def _bind_config(self):
+        """Copy the config values used on every execution onto the instance."""
+        self._name = self.config.name
+        self._version = self.config.version
+        self._retries = self.config.retry_attempts
+        self._retriable = self.config.retriable_exceptions
+        self._cache_size = self.config.cache_size
+        self._include_params = self.config.include_params_in_metadata
+        self._params_limit = self.config.params_repr_limit
+        # Least recently used entries first
+        self._cache: Optional[OrderedDict] = None
+        if self._cache_size > 0 and getattr(type(self)._execute_main_logic, "cacheable", False):
+            self._cache = OrderedDict()
+    
+    def _compile_schema(self, refresh: bool = False):
+        """Build the schema and extract what validation needs from it.
+        
+        Instances of the same class with an equal config share one compiled
+        schema. ``refresh`` builds a private one for this instance only,
+        leaving the shared schema other instances use untouched.
+        """
+        if refresh:
+            self._compiled = _compile(self._build_schema())
+            return
+        key = (type(self), self.config)
+        compiled = self._SCHEMA_CACHE.get(key)
+        if compiled is None:
+            compiled = _compile(self._build_schema())
+            self._SCHEMA_CACHE[key] = compiled
+        self._compiled = compiled
+    
+    def invalidate_schema(self):
+        """Rebuild this instance's schema and config values, e.g. after replacing ``self.config``."""
+        self._bind_config()
+        self._compile_schema(refresh=True)
     
     def get_schema(self) -> Dict[str, Any]:
         """
         Return the input/output schema for this tool.
         
         This schema is used by the agent to understand how to use the tool
-        and by documentation generators to create API docs.
+        and by documentation generators to create API docs. It is built once
+        by ``_build_schema``; call ``invalidate_schema`` to rebuild it.
+        
+        The same dict is returned on every call and shared with other
+        instances of this tool; use ``copy.deepcopy`` on it before modifying.
+        """
+        return self._compiled.schema
+    
+    def _build_schema(self) -> Dict[str, Any]:
+        """Build the input/output schema for this tool.
+        
+        The result must depend only on the tool class and ``self.config``:
+        it is built once and shared by every instance with an equal config.
+        A tool whose schema depends on other instance state should call
+        ``invalidate_schema`` once that state is set.
         """
         return {
             "name": self.config.name,
@@ -82,8 +311,7 @@ class {{tool_class_name}}:
                     # Example:
                     # "query": {
                     #     "type": "string",
-                    #     "description": "The search query to process",
-                    #     "required": True
+                    #     "description": "The search query to process"
                     # },
                     # "limit": {
                     #     "type": "integer",
@@ -94,7 +322,8 @@ class {{tool_class_name}}:
                     # }
                 },
                 "required": [
-                    # TODO: List required parameters here
+                    # TODO: List required parameters here (not a "required"
+                    # key on the property, which JSON schema rejects)
                     # Example: "query"
                 ]
             },
@@ -145,39 +374,35 @@ class {{tool_class_name}}:
         Raises:
             ToolValidationError: If validation fails
         """
-        schema = self.get_schema()
-        required_params = schema["parameters"].get("required", [])
-        properties = schema["parameters"].get("properties", {})
+        compiled = self._compiled
+        if compiled.validate_fn is None:
+            self._check_parameters(compiled, kwargs)
+            return True
         
+        try:
+            compiled.validate_fn(kwargs)
+        except fastjsonschema.JsonSchemaValueException as e:
+            # Give the same message as without fastjsonschema when the basic
+            # checks catch the problem; fastjsonschema's own message (e.g.
+            # "data.units must be one of [...]") is used only for constraints
+            # they do not cover
+            self._check_parameters(compiled, kwargs)
+            raise ToolValidationError(e.message) from e
+        return True
+    
+    @staticmethod
+    def _check_parameters(compiled: CompiledSchema, kwargs: Dict[str, Any]):
+        """Check required parameters, types and numeric ranges, raising ToolValidationError."""
         # Check required parameters
-        for param in required_params:
-            if param not in kwargs:
-                raise ToolValidationError(f"Missing required parameter: {param}")
+        if not compiled.required_set <= kwargs.keys():
+            for param in compiled.required:
+                if param not in kwargs:
+                    raise ToolValidationError(f"Missing required parameter: {param}")
         
         # Validate parameter types and constraints
-        for param_name, param_value in kwargs.items():
-            if param_name in properties:
-                param_schema = properties[param_name]
-                
-                # Type validation
-                expected_type = param_schema.get("type")
-                if expected_type == "string" and not isinstance(param_value, str):
-                    raise ToolValidationError(f"Parameter '{param_name}' must be a string")
-                elif expected_type == "integer" and not isinstance(param_value, int):
-                    raise ToolValidationError(f"Parameter '{param_name}' must be an integer")
-                elif expected_type == "number" and not isinstance(param_value, (int, float)):
-                    raise ToolValidationError(f"Parameter '{param_name}' must be a number")
-                elif expected_type == "boolean" and not isinstance(param_value, bool):
-                    raise ToolValidationError(f"Parameter '{param_name}' must be a boolean")
-                
-                # Range validation for numbers
-                if expected_type in ["integer", "number"]:
-                    if "minimum" in param_schema and param_value < param_schema["minimum"]:
-                        raise ToolValidationError(f"Parameter '{param_name}' must be >= {param_schema['minimum']}")
-                    if "maximum" in param_schema and param_value > param_schema["maximum"]:
-                        raise ToolValidationError(f"Parameter '{param_name}' must be <= {param_schema['maximum']}")
-        
-        return True
+        for spec in compiled.properties:
+            if spec.name in kwargs:
+                spec.check(kwargs[spec.name])
     
     def execute(self, **kwargs) -> Dict[str, Any]:
         """
@@ -189,52 +414,163 @@ class {{tool_class_name}}:
         Returns:
             Dict[str, Any]: Result dictionary with success, data, metadata, and error fields
         """
-        self.execution_count += 1
-        start_time = self._get_timestamp()
+        with self._stats_lock:
+            self.execution_count += 1
+            execution_count = self.execution_count
+        start_time = time.perf_counter()
+        # Shared by the success and error results; execution_time is filled in at the end
+        metadata = self._new_metadata(execution_count, kwargs)
         
         try:
             # Validate input
             self.validate_input(**kwargs)
             
-            self.logger.info(f"Executing {self.config.name} with parameters: {kwargs}")
+            # Formatting kwargs can be costly for large inputs, so skip it when INFO is off
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Executing %s with parameters: %r", self._name, kwargs)
             
-            # Execute the main tool logic with retry
-            result_data = self._execute_with_retry(**kwargs)
+            if self._cache is None:
+                # Execute the main tool logic with retry
+                result_data = self._execute_with_retry(**kwargs)
+            else:
+                result_data = self._execute_cached(kwargs, metadata)
             
             # Prepare successful result
+            metadata["execution_time"] = time.perf_counter() - start_time
             result = {
                 "success": True,
                 "data": result_data,
-                "metadata": {
-                    "tool_name": self.config.name,
-                    "tool_version": self.config.version,
-                    "execution_time": self._get_timestamp() - start_time,
-                    "execution_count": self.execution_count,
-                    "parameters": kwargs
-                }
+                "metadata": metadata
             }
             
-            self.success_count += 1
-            self.logger.info(f"Successfully executed {self.config.name}")
+            with self._stats_lock:
+                self.success_count += 1
+            self.logger.info("Successfully executed %s", self._name)
             return result
             
-        except ToolValidationError as e:
-            self.error_count += 1
-            error_msg = f"Validation error in {self.config.name}: {str(e)}"
-            self.logger.error(error_msg)
-            return self._create_error_result(error_msg, kwargs, start_time)
-            
-        except ToolExecutionError as e:
-            self.error_count += 1
-            error_msg = f"Execution error in {self.config.name}: {str(e)}"
-            self.logger.error(error_msg)
-            return self._create_error_result(error_msg, kwargs, start_time)
+        except Exception as e:
+            with self._stats_lock:
+                self.error_count += 1
+            handled = isinstance(e, _HANDLED)
+            if handled:
+                kind = "Validation" if isinstance(e, ToolValidationError) else "Execution"
+            else:
+                kind = "Unexpected"
+            error_msg = f"{kind} error in {self._name}: {str(e)}"
+            self.logger.error(error_msg, exc_info=not handled)
+            return self._create_error_result(error_msg, metadata, start_time)
+    
+    def _new_metadata(self, execution_count: int, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Start the metadata for one execution; execution_time is filled in later."""
+        metadata = {
+            "tool_name": self._name,
+            "tool_version": self._version,
+            "execution_time": 0.0,
+            "execution_count": execution_count
+        }
+        if self._include_params:
+            metadata["parameters"] = _truncate_params(kwargs, self._params_limit)
+        else:
+            metadata["parameters_hash"] = _params_digest(kwargs)
+        return metadata
+    
+    def execute_batch(self, calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Execute the tool once per parameter dict, amortizing per-call overhead.
+        
+        Each call is validated on its own; the valid ones are then handed to
+        ``_execute_main_logic_batch`` together so tools that can vectorize
+        their work do so. Every result's ``execution_time`` is the time for
+        the whole batch.
+        
+        Args:
+            calls: Input parameters for each execution
             
+        Returns:
+            List[Dict[str, Any]]: One result dictionary per call, in order
+        """
+        start_time = time.perf_counter()
+        with self._stats_lock:
+            first_count = self.execution_count + 1
+            self.execution_count += len(calls)
+        
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Executing %s for a batch of %d calls", self._name, len(calls))
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(calls)
+        metadatas = []
+        valid = []
+        for index, kwargs in enumerate(calls):
+            metadata = self._new_metadata(first_count + index, kwargs)
+            metadatas.append(metadata)
+            try:
+                self.validate_input(**kwargs)
+            except ToolValidationError as e:
+                error_msg = f"Validation error in {self._name}: {str(e)}"
+                self.logger.error(error_msg)
+                results[index] = self._create_error_result(error_msg, metadata, start_time)
+            else:
+                valid.append(index)
+        
+        try:
+            outcomes = self._execute_main_logic_batch([calls[index] for index in valid])
         except Exception as e:
-            self.error_count += 1
-            error_msg = f"Unexpected error in {self.config.name}: {str(e)}"
-            self.logger.error(error_msg, exc_info=True)
-            return self._create_error_result(error_msg, kwargs, start_time)
+            # A failed vectorized call fails every call in it
+            outcomes = [e] * len(valid)
+        
+        elapsed = time.perf_counter() - start_time
+        successes = 0
+        for index, outcome in zip(valid, outcomes):
+            metadata = metadatas[index]
+            if isinstance(outcome, Exception):
+                kind = "Execution" if isinstance(outcome, ToolExecutionError) else "Unexpected"
+                error_msg = f"{kind} error in {self._name}: {str(outcome)}"
+                self.logger.error(error_msg)
+                results[index] = self._create_error_result(error_msg, metadata, start_time)
+            else:
+                metadata["execution_time"] = elapsed
+                results[index] = {
+                    "success": True,
+                    "data": outcome,
+                    "metadata": metadata
+                }
+                successes += 1
+        
+        with self._stats_lock:
+            self.success_count += successes
+            self.error_count += len(calls) - successes
+        return results
+    
+    def _execute_cached(self, kwargs: Dict[str, Any], metadata: Dict[str, Any]) -> Any:
+        """Return the cached result for these parameters, executing on a miss."""
+        try:
+            key = frozenset((name, _hashable(value)) for name, value in kwargs.items())
+            hash(key)
+        except TypeError:
+            # Parameters that cannot be hashed are never cached
+            metadata["cache_hit"] = False
+            return self._execute_with_retry(**kwargs)
+        
+        # Entries are private copies, so callers mutating a result cannot
+        # change what later calls get
+        cache = self._cache
+        with self._cache_lock:
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+        if cached is not None:
+            metadata["cache_hit"] = True
+            return copy.deepcopy(cached[0])
+        
+        metadata["cache_hit"] = False
+        result_data = self._execute_with_retry(**kwargs)
+        entry = (copy.deepcopy(result_data),)
+        with self._cache_lock:
+            cache[key] = entry
+            cache.move_to_end(key)
+            if len(cache) > self._cache_size:
+                cache.popitem(last=False)
+        return result_data
     
     def _execute_with_retry(self, **kwargs) -> Any:
         """
@@ -249,19 +585,31 @@ class {{tool_class_name}}:
         Raises:
             ToolExecutionError: If all retry attempts fail
         """
+        # Single attempt: no retry bookkeeping
+        if self._retries <= 1:
+            try:
+                return self._execute_main_logic(**kwargs)
+            except ToolValidationError:
+                raise
+            except self._retriable as e:
+                raise ToolExecutionError(f"Failed after 1 attempts: {str(e)}") from e
+        
         last_error = None
         
-        for attempt in range(self.config.retry_attempts):
+        for attempt in range(self._retries):
             try:
                 return self._execute_main_logic(**kwargs)
-            except Exception as e:
+            except ToolValidationError:
+                # Invalid input will not become valid on a retry
+                raise
+            except self._retriable as e:
                 last_error = e
-                if attempt < self.config.retry_attempts - 1:
-                    self.logger.warning(f"Attempt {attempt + 1} failed, retrying: {str(e)}")
+                if attempt < self._retries - 1:
+                    self.logger.warning("Attempt %d failed, retrying: %s", attempt + 1, e)
                 else:
-                    self.logger.error(f"All {self.config.retry_attempts} attempts failed")
+                    self.logger.error("All %d attempts failed", self._retries)
         
-        raise ToolExecutionError(f"Failed after {self.config.retry_attempts} attempts: {str(last_error)}")
+        raise ToolExecutionError(f"Failed after {self._retries} attempts: {str(last_error)}")
     
     def _execute_main_logic(self, **kwargs) -> Any:
         """
@@ -292,42 +640,65 @@ class {{tool_class_name}}:
             "parameters_received": kwargs
         }
     
-    def _create_error_result(self, error_msg: str, parameters: Dict[str, Any], start_time: float) -> Dict[str, Any]:
-        """Create a standardized error result."""
+    def _execute_main_logic_batch(self, calls: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Main execution logic for a batch of validated calls.
+        
+        Override this for tools that can process many inputs at once. The
+        default runs each call through the retry path and puts the exception
+        in place of the result for calls that fail.
+        
+        Args:
+            calls: Input parameters for each execution
+            
+        Returns:
+            List[Any]: Result data or the raised exception, one per call, in order
+        """
+        outcomes = []
+        for kwargs in calls:
+            try:
+                outcomes.append(self._execute_with_retry(**kwargs))
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+    
+    def _create_error_result(self, error_msg: str, metadata: Dict[str, Any], start_time: float) -> Dict[str, Any]:
+        """Create a standardized error result around the execution's metadata."""
+        metadata["execution_time"] = time.perf_counter() - start_time
         return {
             "success": False,
             "data": None,
             "error": error_msg,
-            "metadata": {
-                "tool_name": self.config.name,
-                "tool_version": self.config.version,
-                "execution_time": self._get_timestamp() - start_time,
-                "execution_count": self.execution_count,
-                "parameters": parameters
-            }
+            "metadata": metadata
         }
     
-    def _get_timestamp(self) -> float:
-        """Get current timestamp."""
-        import time
-        return time.time()
+    @staticmethod
+    def to_json(result: Dict[str, Any]) -> str:
+        """Serialize a result (or schema, or statistics) as indented JSON."""
+        return _dumps(result)
+    
+    # Monotonic clock for execution times; kept for code that calls it directly
+    _get_timestamp = staticmethod(time.perf_counter)
     
     def get_statistics(self) -> Dict[str, Any]:
-        """Get execution statistics for this tool."""
+        """Get a consistent snapshot of the execution statistics for this tool."""
+        with self._stats_lock:
+            executions, successes, errors = self.execution_count, self.success_count, self.error_count
         return {
-            "tool_name": self.config.name,
-            "total_executions": self.execution_count,
-            "successful_executions": self.success_count,
-            "failed_executions": self.error_count,
-            "success_rate": self.success_count / max(self.execution_count, 1) * 100
+            "tool_name": self._name,
+            "total_executions": executions,
+            "successful_executions": successes,
+            "failed_executions": errors,
+            "success_rate": successes / executions * 100 if executions else 0.0
         }
     
     def reset_statistics(self):
         """Reset execution statistics."""
-        self.execution_count = 0
-        self.success_count = 0
-        self.error_count = 0
-        self.logger.info(f"Reset statistics for {self.config.name}")
+        with self._stats_lock:
+            self.execution_count = 0
+            self.success_count = 0
+            self.error_count = 0
+        self.logger.info("Reset statistics for %s", self._name)
 
 
 # Example usage and testing
@@ -344,17 +715,16 @@ def main():
     
     # Print the tool schema
     print("Tool Schema:")
-    import json
-    print(json.dumps(tool.get_schema(), indent=2))
+    print(tool.to_json(tool.get_schema()))
     
     # Test the tool
     print("\nTesting tool execution:")
     result = tool.execute(test_param="example_value")
-    print(json.dumps(result, indent=2))
+    print(tool.to_json(result))
     
     # Print statistics
     print("\nTool Statistics:")
-    print(json.dumps(tool.get_statistics(), indent=2))
+    print(tool.to_json(tool.get_statistics()))
 
 
 if __name__ == "__main__":
@@ -19,12 +19,6 @@ if ! command -v python3 &> /dev/null; then
     exit 1
 fi
 
-# Install required dependencies if needed
-echo "📦 Installing required Python packages..."
-pip3 install -q pyyaml pandas openpyxl 2>/dev/null || {
-    echo "⚠️ Warning: Could not install some packages. Continuing anyway..."
-}
-
 # Run the update script
 echo "🚀 Running README update script..."
 python3 .github/scripts/update_readme.py